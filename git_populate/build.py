@@ -3,7 +3,8 @@
 GitHub Issue Generator for Deshio ERP API Documentation
 
 This script reads API documentation from a CSV file and generates GitHub issue titles 
-and descriptions using OpenRouter's LLM models. It creates a new CSV with the original 
+and descriptions using an LLM provider (OpenRouter by default, or any OpenAI-compatible
+API including a local llama.cpp/vLLM server). It creates a new CSV with the original 
 data plus generated issue descriptions.
 
 Usage:
@@ -11,6 +12,21 @@ Usage:
 
 Example:
     python build.py --model anthropic/claude-3.5-sonnet
+
+    # Share one generation between near-duplicate endpoints (e.g. CRUD verbs)
+    python build.py --model anthropic/claude-3.5-sonnet --cluster
+
+    # Use a local OpenAI-compatible server (llama.cpp, vLLM, ...) instead of OpenRouter
+    python build.py --model qwen2.5-7b-instruct --provider local --base-url http://localhost:8080/v1
+
+    # Merge the overlapping catalogs so shared endpoints are generated once
+    python build.py --model anthropic/claude-3.5-sonnet --input doc.csv ../api/*.csv
+
+    # Pick the fastest acceptable model per category from past runs, escalating on bad JSON
+    python build.py --auto-model --models meta-llama/llama-3.1-8b-instruct,openai/gpt-4o-mini,anthropic/claude-3.5-sonnet
+
+    # Record cProfile stats, per-phase wall clock and collapsed stacks in ./profile
+    python build.py --model anthropic/claude-3.5-sonnet --profile
 """
 
 import argparse
@@ -18,13 +34,24 @@ import csv
 import json
 import os
 import sys
+import time
 from typing import Dict, List, Optional, Set
+
+# Captured before third-party imports so --profile can report their startup cost
+PROCESS_STARTED = time.perf_counter()
+
 import pandas as pd
 import requests
 from dotenv import load_dotenv
-import time
 from colorama import init, Fore, Back, Style
 from datetime import datetime
+from providers import PROVIDERS, LLMProvider, create_provider
+from models import ISSUE_FIELDS, METHOD_COLUMN, Endpoint, GeneratedIssue
+from catalog import endpoint_key, load_catalogs
+from clustering import canonical_index, cluster_endpoints, describe_clusters, specialize
+from profiling import Profiler
+from progress import MODES as PROGRESS_MODES, ProgressRenderer, emit
+from model_selector import OUTCOME_FAILED, OUTCOME_OK, OUTCOME_PARSE_ERROR, ModelSelector
 
 # Load environment variables
 load_dotenv()
@@ -35,19 +62,19 @@ init(autoreset=True)
 # Color utility functions
 def print_success(message: str):
     """Print success message in green"""
-    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
 
 def print_error(message: str):
     """Print error message in red"""
-    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
 
 def print_warning(message: str):
     """Print warning message in yellow"""
-    print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
 
 def print_info(message: str):
     """Print info message in blue"""
-    print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
 
 def print_header(message: str):
     """Print header message in cyan with decoration"""
@@ -56,16 +83,6 @@ def print_header(message: str):
     print(f"{Fore.CYAN}{message}")
     print(f"{Fore.CYAN}{separator}{Style.RESET_ALL}\n")
 
-def print_progress(current: int, total: int, message: str):
-    """Print progress with colored progress bar"""
-    percentage = (current / total) * 100
-    bar_length = 30
-    filled_length = int(bar_length * current // total)
-    bar = f"{Fore.GREEN}{'█' * filled_length}{Fore.WHITE}{'░' * (bar_length - filled_length)}{Style.RESET_ALL}"
-    print(f"\r{Fore.MAGENTA}[{current:3d}/{total:3d}] {bar} {percentage:6.1f}% {Fore.CYAN}{message}{Style.RESET_ALL}", end="", flush=True)
-    if current == total:
-        print()  # New line when complete
-
 PRIMARY_CONTEXT = '''
 Deshio is a Laravel-based ERP for retail/omni with ~290 REST APIs over a normalized ERD covering catalog, orders, inventory, logistics, payments, RBAC, and audits.
 Core entities: product/category/vendor with attributes (field/feature), media (product_image), barcodes, pricing (price_override), promotions; stores/branches; customers + tags/blacklist.
@@ -88,22 +105,40 @@ Design enables deterministic admin assignment for online orders, safe reservatio
 '''
 
 
-class OpenRouterClient:
-    """Client for interacting with OpenRouter API"""
+class IssueGeneratorClient:
+    """Client for generating issue descriptions through an LLM provider"""
     
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://openrouter.ai/api/v1"
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "HTTP-Referer": "https://github.com/sakhadib/deshio-erp-backend",
-            "X-Title": "Deshio ERP Issue Generator",
-            "Content-Type": "application/json"
-        }
+    def __init__(self, provider: LLMProvider, selector: Optional[ModelSelector] = None):
+        self.provider = provider
+        # Every call is recorded in the selector's metrics history
+        self.selector = selector
+        self.last_outcome = OUTCOME_OK
     
-    def generate_issue_description(self, model: str, api_data: Dict) -> Optional[Dict[str, str]]:
+    def record(self, model: str, endpoint: Endpoint, started: float, outcome: str):
+        """Remember the outcome of the last call and add it to the metrics history"""
+        self.last_outcome = outcome
+        if self.selector is None:
+            return
+        usage = self.provider.last_usage if outcome != OUTCOME_FAILED else {}
+        self.selector.record(
+            model,
+            endpoint.category,
+            time.perf_counter() - started,
+            outcome,
+            tokens=int(usage.get('total_tokens') or 0),
+            cost=float(usage.get('cost') or 0.0)
+        )
+    
+    def generate_issue_description(self, model: str, endpoint: Endpoint) -> Optional[Dict[str, str]]:
         """Generate GitHub issue title and description for an API endpoint"""
         
+        # Request/response sketches are only available from the api/ catalogs
+        field_details = ""
+        if endpoint.request_fields:
+            field_details += f"\n- Request fields (JSON): {endpoint.request_fields}"
+        if endpoint.response_fields:
+            field_details += f"\n- Response fields (JSON): {endpoint.response_fields}"
+        
         prompt = f"""
 You are a technical writer creating GitHub issues for API implementation. You MUST respond with valid JSON only.
 
@@ -113,12 +148,12 @@ Context about Deshio ERP:
 {PRIMARY_CONTEXT}
 
 API Details:
-- Category: {api_data['category']}
-- Title: {api_data['api_title']}
-- Description: {api_data['api_description']}
-- Route: {api_data['route']}
-- HTTP Method: {api_data['Type']}
-- Authentication: {api_data['Authentication_Type']}
+- Category: {endpoint.category}
+- Title: {endpoint.title}
+- Description: {endpoint.description}
+- Route: {endpoint.route}
+- HTTP Method: {endpoint.method}
+- Authentication: {endpoint.auth_type}{field_details}
 
 Requirements:
 1. Create a clear, concise GitHub issue title (max 80 characters)
@@ -135,35 +170,22 @@ Requirements:
 You MUST respond with ONLY valid JSON in this exact format:
 {{
     "title": "Your issue title here",
-    "description": "## Overview\\n\\nDetailed description with proper line breaks...\\n\\n## API Specifications\\n\\n- **Route:** {api_data['route']}\\n- **Method:** {api_data['Type']}\\n- **Authentication:** {api_data['Authentication_Type']}\\n- **Category:** {api_data['category']}\\n\\n## Acceptance Criteria\\n\\n- [ ] Implement endpoint\\n- [ ] Add validation\\n- [ ] Write tests\\n\\n## Technical Requirements\\n\\n- Laravel controller and routes\\n- Input validation\\n- Proper error handling"
+    "description": "## Overview\\n\\nDetailed description with proper line breaks...\\n\\n## API Specifications\\n\\n- **Route:** {endpoint.route}\\n- **Method:** {endpoint.method}\\n- **Authentication:** {endpoint.auth_type}\\n- **Category:** {endpoint.category}\\n\\n## Acceptance Criteria\\n\\n- [ ] Implement endpoint\\n- [ ] Add validation\\n- [ ] Write tests\\n\\n## Technical Requirements\\n\\n- Laravel controller and routes\\n- Input validation\\n- Proper error handling"
 }}
 
 Do NOT include any text before or after the JSON. Return ONLY the JSON object.
 """
 
-        payload = {
-            "model": model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 3000
-        }
+        messages = [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
         
+        started = time.perf_counter()
         try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
+            content = self.provider.chat(model, messages, temperature=0.7, max_tokens=3000)
             
             # Clean up the content to extract JSON if there's extra text
             if content.startswith('```json'):
@@ -175,83 +197,129 @@ Do NOT include any text before or after the JSON. Return ONLY the JSON object.
             # Try to parse as JSON
             try:
                 issue_data = json.loads(content)
+                # A reply without both fields counts as a validation failure
+                valid = isinstance(issue_data, dict) and issue_data.get("title") and issue_data.get("description")
+                if not isinstance(issue_data, dict):
+                    issue_data = {}
+                self.record(model, endpoint, started, OUTCOME_OK if valid else OUTCOME_PARSE_ERROR)
                 return {
-                    "title": issue_data.get("title", f"Implement {api_data['api_title']} API"),
+                    "title": issue_data.get("title", f"Implement {endpoint.title} API"),
                     "description": issue_data.get("description", "Implementation details not generated")
                 }
             except json.JSONDecodeError as e:
                 print_warning(f"JSON parse error: {e}")
                 print_warning(f"Raw content: {content[:200]}...")
+                self.record(model, endpoint, started, OUTCOME_PARSE_ERROR)
                 # Fallback: create structured description
-                fallback_description = f"""## Overview\n\nImplement the {api_data['api_title']} API endpoint.\n\n## API Specifications\n\n- **Route:** {api_data['route']}\n- **Method:** {api_data['Type']}\n- **Authentication:** {api_data['Authentication_Type']}\n- **Category:** {api_data['category']}\n- **Description:** {api_data['api_description']}\n\n## Acceptance Criteria\n\n- [ ] Implement {api_data['Type']} endpoint at {api_data['route']}\n- [ ] Add proper authentication ({api_data['Authentication_Type']})\n- [ ] Implement input validation\n- [ ] Add error handling\n- [ ] Write unit tests\n- [ ] Update API documentation\n\n## Technical Requirements\n\n- Laravel controller and routes\n- Request validation\n- Response formatting\n- Error handling\n- Authentication middleware"""
+                fallback_description = f"""## Overview\n\nImplement the {endpoint.title} API endpoint.\n\n## API Specifications\n\n- **Route:** {endpoint.route}\n- **Method:** {endpoint.method}\n- **Authentication:** {endpoint.auth_type}\n- **Category:** {endpoint.category}\n- **Description:** {endpoint.description}\n\n## Acceptance Criteria\n\n- [ ] Implement {endpoint.method} endpoint at {endpoint.route}\n- [ ] Add proper authentication ({endpoint.auth_type})\n- [ ] Implement input validation\n- [ ] Add error handling\n- [ ] Write unit tests\n- [ ] Update API documentation\n\n## Technical Requirements\n\n- Laravel controller and routes\n- Request validation\n- Response formatting\n- Error handling\n- Authentication middleware"""
                 return {
-                    "title": f"Implement {api_data['api_title']} API",
+                    "title": f"Implement {endpoint.title} API",
                     "description": fallback_description
                 }
                 
         except requests.exceptions.RequestException as e:
             print_error(f"API request failed: {e}")
+            self.record(model, endpoint, started, OUTCOME_FAILED)
             return None
         except (KeyError, IndexError) as e:
             print_error(f"Failed to parse API response: {e}")
+            self.record(model, endpoint, started, OUTCOME_FAILED)
             return None
 
 
-def load_csv_data(file_path: str) -> List[Dict]:
-    """Load API data from CSV file"""
+def generate_with_escalation(client: IssueGeneratorClient, selector: ModelSelector, endpoint: Endpoint):
+    """Generate with the selector's pick for the category, escalating to stronger models on parse failures
+
+    Returns (issue result, model that produced it, number of LLM calls made).
+    """
+    model = selector.choose(endpoint.category)
+    issue_result = client.generate_issue_description(model, endpoint)
+    calls = 1
+    while client.last_outcome == OUTCOME_PARSE_ERROR:
+        stronger = selector.escalate(model)
+        if stronger is None:
+            break
+        print_warning(f"Escalating {endpoint.title[:35]} from {model} to {stronger}")
+        model = stronger
+        retry = client.generate_issue_description(model, endpoint)
+        calls += 1
+        if retry is not None:
+            issue_result = retry
+    return issue_result, model, calls
+
+
+def load_csv_data(file_paths: List[str]) -> List[Endpoint]:
+    """Load API data from one or more catalog CSVs, merging endpoints listed in several"""
     try:
-        print_info(f"Loading CSV data from: {file_path}")
-        df = pd.read_csv(file_path)
-        print_success(f"Successfully loaded {len(df)} records")
-        return df.to_dict('records')
-    except FileNotFoundError:
-        print_error(f"CSV file '{file_path}' not found")
+        print_info(f"Loading CSV data from: {', '.join(file_paths)}")
+        api_data, duplicates = load_catalogs(file_paths)
+        print_success(f"Successfully loaded {len(api_data)} records")
+        if duplicates:
+            print_info(f"Merged {duplicates} duplicate rows across catalogs (one generation per endpoint)")
+        return api_data
+    except FileNotFoundError as e:
+        print_error(f"CSV file '{e.filename}' not found")
         sys.exit(1)
     except Exception as e:
         print_error(f"Failed to read CSV file: {e}")
         sys.exit(1)
 
 
-def get_processed_entries(output_path: str) -> Set[int]:
+def check_resume_ids(df: pd.DataFrame, api_data: List[Endpoint]) -> int:
+    """Count output rows whose id now names a different (method, route) than in the input"""
+    expected = {api.id: endpoint_key(api.method, api.route) for api in api_data}
+    return sum(
+        1 for api_id, method, route in zip(df['id'], df[METHOD_COLUMN], df['route'])
+        if expected.get(int(api_id)) != endpoint_key(str(method), str(route))
+    )
+
+def get_processed_entries(output_path: str, api_data: List[Endpoint]) -> Set[int]:
     """Get set of already processed API entry IDs from existing output file"""
     processed = set()
     try:
         if os.path.exists(output_path):
             df = pd.read_csv(output_path)
+            # Ids are positions in the --input catalogs; refuse to resume against a different list
+            mismatched = check_resume_ids(df, api_data)
+            if mismatched:
+                print_error(f"{mismatched} rows in {output_path} have ids that refer to other endpoints in the current --input")
+                print_warning("Resume with the --input list that produced the file, or run without --resume")
+                sys.exit(1)
             # Get all existing IDs that have valid issue descriptions
-            for _, row in df.iterrows():
-                if 'issue_description' in row and pd.notna(row['issue_description']) and row['issue_description'] != "Failed to generate issue description":
-                    processed.add(int(row['id']))
+            if 'issue_description' in df.columns:
+                descriptions = df['issue_description']
+                valid = descriptions.notna() & (descriptions != "Failed to generate issue description")
+                processed.update(int(api_id) for api_id in df.loc[valid, 'id'])
             print_info(f"Found {len(processed)} already processed entries")
     except Exception as e:
         print_warning(f"Could not read existing output file: {e}")
     return processed
 
-def append_to_csv(issue_data: Dict, output_path: str, write_header: bool = False):
+def init_csv(output_path: str):
+    """Create (or truncate) the output CSV file with only the header row"""
+    try:
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            csv.DictWriter(csvfile, fieldnames=ISSUE_FIELDS).writeheader()
+    except Exception as e:
+        print_error(f"Failed to write to CSV: {e}")
+
+def append_to_csv(issue: GeneratedIssue, output_path: str):
     """Append single issue entry to CSV file"""
     try:
-        file_exists = os.path.exists(output_path)
-        mode = 'w' if write_header and not file_exists else 'a'
-        
-        with open(output_path, mode, newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'a', newline='', encoding='utf-8') as csvfile:
             # Include all original API data plus issue fields
-            fieldnames = ['id', 'category', 'api_title', 'api_description', 'route', 'Type', 'Authentication_Type', 'issue_title', 'issue_description']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            if write_header and not file_exists:
-                writer.writeheader()
-            
-            writer.writerow(issue_data)
+            writer = csv.DictWriter(csvfile, fieldnames=ISSUE_FIELDS)
+            writer.writerow(issue.to_row())
             csvfile.flush()  # Ensure data is written immediately
             
     except Exception as e:
         print_error(f"Failed to write to CSV: {e}")
 
-def save_enhanced_csv(data: List[Dict], output_path: str):
+def save_enhanced_csv(data: List[GeneratedIssue], output_path: str):
     """Save the enhanced data with issue descriptions to a new CSV file"""
     try:
         print_info(f"Saving enhanced data to: {output_path}")
-        df = pd.DataFrame(data)
+        df = pd.DataFrame([issue.to_row() for issue in data], columns=ISSUE_FIELDS)
         df.to_csv(output_path, index=False)
         print_success(f"Enhanced CSV saved successfully with {len(data)} records")
     except Exception as e:
@@ -259,6 +327,19 @@ def save_enhanced_csv(data: List[Dict], output_path: str):
         sys.exit(1)
 
 
+def report_profile(profiler: Profiler):
+    """Print the per-phase breakdown and where the profiling output was written"""
+    paths = profiler.stop()
+    if not paths:
+        return
+    print_header("⏱️ Profile")
+    for line in profiler.phase_report():
+        print_info(line)
+    print_success(f"pstats: {paths['pstats']}")
+    print_success(f"Collapsed stacks (flamegraph): {paths['collapsed']}")
+    print_success(f"Report: {paths['report']}")
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -266,58 +347,168 @@ def main():
     )
     parser.add_argument(
         "--model", 
-        required=True,
-        help="OpenRouter model ID (e.g., anthropic/claude-3.5-sonnet)"
+        help="Model ID for the selected provider (e.g., anthropic/claude-3.5-sonnet); required unless --auto-model"
+    )
+    parser.add_argument(
+        "--auto-model",
+        action="store_true",
+        help="Choose a model per endpoint from --models using the metrics of previous runs"
+    )
+    parser.add_argument(
+        "--models",
+        help="Comma-separated candidate models for --auto-model, ordered from cheapest/fastest to strongest"
+    )
+    parser.add_argument(
+        "--model-metrics",
+        default="model_metrics.json",
+        help="Per-model latency/failure/cost history updated by every run (default: model_metrics.json)"
+    )
+    parser.add_argument(
+        "--min-success",
+        type=float,
+        default=0.9,
+        help="Minimum estimated success rate for --auto-model to consider a model (default: 0.9)"
+    )
+    parser.add_argument(
+        "--explore",
+        type=float,
+        default=0.05,
+        help="Fraction of --auto-model picks made at random to refresh stale metrics (default: 0.05)"
+    )
+    parser.add_argument(
+        "--provider",
+        choices=list(PROVIDERS),
+        default="openrouter",
+        help="LLM provider backend (default: openrouter)"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Override the provider's API base URL (e.g., http://localhost:8080/v1)"
     )
     parser.add_argument(
         "--input",
-        default="doc.csv",
-        help="Input CSV file path (default: doc.csv)"
+        nargs="+",
+        default=["doc.csv"],
+        help="Input catalog CSV file path(s); endpoints present in several are merged (default: doc.csv)"
     )
     parser.add_argument(
         "--output",
         default="enhanced_doc.csv",
         help="Output CSV file path (default: enhanced_doc.csv)"
     )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=0,
+        help="Request budget per minute shared by all concurrent runs using the same key "
+             "(default: 0 = learned from the provider's rate limit headers and 429s, shared the same way)"
+    )
+    parser.add_argument(
+        "--rate-limit-db",
+        help="SQLite file holding rate limit state shared by concurrent runs "
+             "(default: $DESHIO_RATE_LIMIT_DB or ~/.cache/deshio-erp/rate_limits.sqlite3)"
+    )
     parser.add_argument(
         "--resume",
         action="store_true",
         help="Resume processing by skipping already completed entries"
     )
+    parser.add_argument(
+        "--cluster",
+        action="store_true",
+        help="Generate one issue per cluster of near-duplicate endpoints and specialize it per row"
+    )
+    parser.add_argument(
+        "--cluster-threshold",
+        type=float,
+        default=0.8,
+        help="Minimum estimated similarity for two endpoints to share a generation (default: 0.8)"
+    )
+    parser.add_argument(
+        "--progress",
+        choices=PROGRESS_MODES,
+        default="auto",
+        help="Progress output: redrawn bar (tty), periodic summaries (line), JSON events (json) or off; "
+             "auto uses tty on terminals and line otherwise (default: auto)"
+    )
+    parser.add_argument(
+        "--progress-file",
+        help="Append --progress json events to this file instead of stderr"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record cProfile stats, per-phase timings and a collapsed-stack file"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profile",
+        help="Directory for profiling output (default: profile)"
+    )
     
     args = parser.parse_args()
+    if args.auto_model:
+        if not args.models:
+            parser.error("--auto-model requires --models")
+        candidate_models = [model.strip() for model in args.models.split(",") if model.strip()]
+    elif args.model:
+        candidate_models = [args.model]
+    else:
+        parser.error("--model is required unless --auto-model is used")
+    profiler = Profiler(args.profile, "build", args.profile_dir)
+    profiler.start(PROCESS_STARTED)
     
     # Print startup header
     print_header("🚀 Deshio ERP GitHub Issue Generator")
     start_time = datetime.now()
     print_info(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print_info(f"Model: {Fore.YELLOW}{args.model}{Style.RESET_ALL}")
-    print_info(f"Input file: {Fore.YELLOW}{args.input}{Style.RESET_ALL}")
+    if args.auto_model:
+        print_info(f"Model: {Fore.YELLOW}auto ({' → '.join(candidate_models)}){Style.RESET_ALL}")
+    else:
+        print_info(f"Model: {Fore.YELLOW}{args.model}{Style.RESET_ALL}")
+    print_info(f"Provider: {Fore.YELLOW}{args.provider}{Style.RESET_ALL}")
+    print_info(f"Input file(s): {Fore.YELLOW}{', '.join(args.input)}{Style.RESET_ALL}")
     print_info(f"Output file: {Fore.YELLOW}{args.output}{Style.RESET_ALL}")
     print_info(f"Resume mode: {Fore.YELLOW}{'Enabled' if args.resume else 'Disabled'}{Style.RESET_ALL}")
     print_info(f"Continuous writing: {Fore.GREEN}Enabled{Style.RESET_ALL}")
+    print_info(f"Clustering: {Fore.YELLOW}{f'Enabled (threshold {args.cluster_threshold})' if args.cluster else 'Disabled'}{Style.RESET_ALL}")
     
-    # Check for API key
-    api_key = os.getenv("OPENROUTER_API_KEY")
-    if not api_key:
-        print_error("OPENROUTER_API_KEY environment variable not found")
+    # Initialize LLM provider (checks for its API key)
+    print_info(f"Initializing {args.provider} provider...")
+    try:
+        provider = create_provider(args.provider, args.base_url, args.requests_per_minute, args.rate_limit_db)
+    except ValueError as e:
+        print_error(str(e))
         print_warning("Please set it in your .env file or environment")
         sys.exit(1)
-    else:
-        print_success("OpenRouter API key found")
-    
-    # Initialize OpenRouter client
-    print_info("Initializing OpenRouter client...")
-    client = OpenRouterClient(api_key)
-    print_success("OpenRouter client initialized")
+    selector = ModelSelector(candidate_models, args.model_metrics, args.min_success, args.explore,
+                             on_warning=print_warning)
+    client = IssueGeneratorClient(provider, selector)
+    print_success(f"{args.provider} provider initialized ({provider.base_url})")
     
     # Load CSV data
-    api_data = load_csv_data(args.input)
+    with profiler.phase("load"):
+        api_data = load_csv_data(args.input)
     
     # Get already processed entries if resume mode is enabled
     processed_entries = set()
     if args.resume:
-        processed_entries = get_processed_entries(args.output)
+        with profiler.phase("resume scan"):
+            processed_entries = get_processed_entries(args.output, api_data)
+    
+    # Group near-duplicate pending endpoints so each cluster costs one LLM call
+    canonical_of = {}
+    if args.cluster:
+        with profiler.phase("cluster"):
+            pending = [i for i in range(len(api_data)) if api_data[i].id not in processed_entries]
+            clusters = cluster_endpoints([api_data[i] for i in pending], args.cluster_threshold)
+            canonical_of = {pending[k]: pending[v] for k, v in canonical_index(clusters).items()}
+            summary = describe_clusters([api_data[i] for i in pending], clusters)
+        if summary:
+            print_success(f"Clustered {summary}")
+        else:
+            print_info("No near-duplicate endpoints found")
+    generated = {}
     
     # Process each API endpoint
     print_header("🔄 Processing API Endpoints")
@@ -325,71 +516,62 @@ def main():
     failed_count = 0
     skipped_count = 0
     total_processed = 0
+    llm_calls = 0
+    model_counts: Dict[str, int] = {}
     
     # Initialize CSV file with headers if not resuming or file doesn't exist
     if not args.resume or not os.path.exists(args.output):
         print_info("Initializing output CSV file...")
-        header_data = {
-            'id': '', 'category': '', 'api_title': '', 'api_description': '', 
-            'route': '', 'Type': '', 'Authentication_Type': '', 
-            'issue_title': '', 'issue_description': ''
-        }
-        append_to_csv(header_data, args.output, write_header=True)
-        # Remove the sample entry
-        with open(args.output, 'r+', encoding='utf-8') as f:
-            lines = f.readlines()
-            f.seek(0)
-            f.writelines(lines[:1])  # Keep only header
-            f.truncate()
+        init_csv(args.output)
     
-    for i, api in enumerate(api_data, 1):
-        # Use 1-based index as ID
-        api_id = i
-        
-        # Skip if already processed
-        if api_id in processed_entries:
-            skipped_count += 1
-            print_progress(i, len(api_data), f"⏭️ SKIPPED: {api['category']} - {api['api_title'][:35]}...")
-            continue
-        
-        # Show progress
-        print_progress(i, len(api_data), f"🔄 {api['category']} - {api['api_title'][:35]}...")
-        
-        # Generate issue description
-        issue_result = client.generate_issue_description(args.model, api)
-        
-        # Prepare complete data for CSV (all original API data + issue data)
-        issue_data = {
-            'id': api_id,
-            'category': api.get('category', ''),
-            'api_title': api.get('api_title', ''),
-            'api_description': api.get('api_description', ''),
-            'route': api.get('route', ''),
-            'Type': api.get('Type', ''),
-            'Authentication_Type': api.get('Authentication_Type', ''),
-            'issue_title': '',
-            'issue_description': ''
-        }
-        
-        if issue_result:
-            issue_data['issue_title'] = issue_result['title']
-            issue_data['issue_description'] = issue_result['description']
-            success_count += 1
-            print_progress(i, len(api_data), f"✅ DONE: {api['category']} - {api['api_title'][:35]}...")
-        else:
-            issue_data['issue_title'] = f"Implement {api['api_title']} API"
-            issue_data['issue_description'] = "Failed to generate issue description"
-            failed_count += 1
-            print_progress(i, len(api_data), f"❌ FAILED: {api['category']} - {api['api_title'][:35]}...")
-        
-        # Write to CSV immediately
-        append_to_csv(issue_data, args.output)
-        total_processed += 1
-        
-        # NO DELAY - removed time.sleep(0.1)
+    # Rows only publish events; the renderer thread owns the terminal
+    with ProgressRenderer(len(api_data), args.progress, "build", args.progress_file) as progress:
+        for i, api in enumerate(api_data, 1):
+            # Skip if already processed
+            if api.id in processed_entries:
+                skipped_count += 1
+                progress.update(i, f"⏭️ SKIPPED: {api.category} - {api.title[:35]}...", "skipped")
+                continue
+            
+            # Show progress
+            progress.update(i, f"🔄 {api.category} - {api.title[:35]}...")
+            
+            # Reuse the canonical generation of this endpoint's cluster when available
+            canonical = canonical_of.get(i - 1, i - 1)
+            with profiler.phase("generate"):
+                if canonical != i - 1 and generated.get(canonical):
+                    issue_result = specialize(generated[canonical], api_data[canonical], api)
+                else:
+                    if args.auto_model:
+                        issue_result, model, calls = generate_with_escalation(client, selector, api)
+                    else:
+                        model, calls = args.model, 1
+                        issue_result = client.generate_issue_description(model, api)
+                    llm_calls += calls
+                    model_counts[model] = model_counts.get(model, 0) + 1
+                    if args.cluster:
+                        generated[i - 1] = issue_result
+            
+            # Prepare complete data for CSV (all original API data + issue data)
+            if issue_result:
+                issue = GeneratedIssue(api, issue_result['title'], issue_result['description'])
+                success_count += 1
+                progress.update(i, f"✅ DONE: {api.category} - {api.title[:35]}...", "done")
+            else:
+                issue = GeneratedIssue(api, f"Implement {api.title} API", "Failed to generate issue description")
+                failed_count += 1
+                progress.update(i, f"❌ FAILED: {api.category} - {api.title[:35]}...", "failed")
+            
+            # Write to CSV immediately
+            with profiler.phase("write"):
+                append_to_csv(issue, args.output)
+            total_processed += 1
+            
+            # NO DELAY - removed time.sleep(0.1)
     
-    print("\n")
+    print()
     print_success(f"Continuous CSV writing completed to: {args.output}")
+    selector.save()
     
     # Calculate and display summary
     end_time = datetime.now()
@@ -403,6 +585,12 @@ def main():
     if skipped_count > 0:
         print_info(f"Skipped (already done): {skipped_count}")
     print_info(f"Actually processed: {total_processed}")
+    print_info(f"LLM calls made: {llm_calls}")
+    if args.auto_model:
+        for model, count in sorted(model_counts.items(), key=lambda item: -item[1]):
+            print_info(f"Endpoints generated by {model}: {count}")
+        for line in selector.summary():
+            print_info(f"History: {line}")
     print_info(f"Processing time: {duration.total_seconds():.1f} seconds")
     if total_processed > 0:
         print_info(f"Average time per endpoint: {(duration.total_seconds() / total_processed):.1f} seconds")
@@ -415,6 +603,8 @@ def main():
     else:
         print_warning(f"⚠️ {failed_count} endpoints had issues - check the logs above")
     
+    report_profile(profiler)
+    
     print(f"\n{Fore.CYAN}Happy coding! 🚀{Style.RESET_ALL}")
 
 
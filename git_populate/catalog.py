@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Multi-catalog loader for Deshio ERP API Documentation
+
+The endpoint catalogs overlap but use different schemas:
+- git_populate/doc.csv: category, api_title, api_description, route, Type, Authentication_Type
+- api/Deshio_API_Catalog.csv: human-readable headers such as
+  "route (api/.../...)" plus "req fields (json)" / "res fields (json)"
+- api/Deshio_API_Catalog__Expanded____290_endpoints.csv: same headers, no req/res
+
+load_catalogs() normalizes every schema and hash-joins the rows on
+(method, normalized route), so each unique endpoint appears once with the
+first non-empty value of every field across catalogs.
+
+Endpoints keep the row id of the first catalog (its 1-based position, as
+build.py has always numbered doc.csv), so adding catalogs after it never
+renumbers them. Endpoints found only in later catalogs are numbered after
+the first catalog's highest id, in merge order.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from models import AUTH_COLUMN, METHOD_COLUMN, Endpoint, endpoints_from_frame
+
+# Normalized headers that differ from the column names Endpoint.from_row reads
+# (the rest, e.g. api_title or req_fields, already normalize to them)
+COLUMN_ALIASES = {
+    'type': METHOD_COLUMN,
+    'method': METHOD_COLUMN,
+    'authentication_type': AUTH_COLUMN,
+}
+
+_PARAM_RE = re.compile(r"\{[^}]*\}")
+_PARENTHETICAL_RE = re.compile(r"\(.*?\)")
+
+# Endpoint attributes filled from later catalogs when the first one left them empty
+MERGED_FIELDS = ('category', 'title', 'description', 'auth_type', 'request_fields', 'response_fields')
+
+
+def normalize_column(name: str) -> str:
+    """'Authentication Type (Admin, Employee, None)' -> 'Authentication_Type'"""
+    key = _PARENTHETICAL_RE.sub("", str(name)).strip().lower()
+    key = re.sub(r"[^a-z0-9]+", "_", key).strip("_")
+    return COLUMN_ALIASES.get(key, key)
+
+
+def endpoint_key(method: str, route: str) -> Tuple[str, str]:
+    """Join key: lower-case method and route with every {param} collapsed"""
+    route = _PARAM_RE.sub("{}", route.strip().strip("/").lower())
+    return method.strip().lower(), route
+
+
+def read_catalog(path: str) -> List[Endpoint]:
+    """Read one catalog CSV in any of the known schemas"""
+    df = pd.read_csv(path)
+    df = df.rename(columns={column: normalize_column(column) for column in df.columns})
+    return endpoints_from_frame(df)
+
+
+def merge_endpoints(catalogs: List[List[Endpoint]]) -> Tuple[List[Endpoint], int]:
+    """Hash-join catalogs on (method, route); returns unique endpoints and the duplicate count"""
+    merged: Dict[Tuple[str, str], Endpoint] = {}
+    duplicates = 0
+    next_id = max((endpoint.id for endpoint in catalogs[0]), default=0) + 1 if catalogs else 1
+    for position, endpoints in enumerate(catalogs):
+        for endpoint in endpoints:
+            key = endpoint_key(endpoint.method, endpoint.route)
+            existing = merged.get(key)
+            if existing is None:
+                if position > 0:
+                    endpoint.id = next_id
+                    next_id += 1
+                merged[key] = endpoint
+                continue
+            duplicates += 1
+            for field in MERGED_FIELDS:
+                current = getattr(existing, field)
+                if not current or current == 'nan':
+                    setattr(existing, field, getattr(endpoint, field))
+
+    return list(merged.values()), duplicates
+
+
+def load_catalogs(paths: List[str]) -> Tuple[List[Endpoint], int]:
+    """Load, normalize and deduplicate several catalogs (earlier paths take precedence)"""
+    return merge_endpoints([read_catalog(path) for path in paths])
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate endpoint clustering for Deshio ERP API Documentation
+
+Groups catalog rows that only differ by the resource they act on (e.g. the same
+CRUD verbs across products, vendors and stores) so that build.py can generate
+one canonical issue per cluster and specialize it locally for every other row.
+
+Similarity is estimated with MinHash signatures over word shingles of the
+entity-normalized title, description and route, with LSH banding to find
+candidate pairs without comparing every row against every other row.
+
+Usage (self-check of specialize() on sample issues):
+    python clustering.py
+"""
+
+import re
+import sys
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from models import Endpoint
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+ENTITY_TOKEN = "\x00entity\x00"
+PARAM_TOKEN = "{param}"
+
+_PARAM_RE = re.compile(r"\{[^}]*\}")
+_WORD_RE = re.compile(r"[a-z0-9{}\x00]+")
+# "- **Category:** orders" and similar specification bullets in generated issues
+_SPEC_LINE_RE = re.compile(r"^[ \t]*[-*][ \t]+\*\*[^*\n]+:\*\*.*$", re.MULTILINE)
+
+
+def _permutations() -> List[Tuple[int, int]]:
+    """Deterministic (a, b) coefficients for the MinHash permutations"""
+    coefficients = []
+    for seed in range(NUM_PERMUTATIONS):
+        a = zlib.crc32(f"a{seed}".encode()) | 1
+        b = zlib.crc32(f"b{seed}".encode())
+        coefficients.append((a, b))
+    return coefficients
+
+
+PERMUTATIONS = _permutations()
+
+
+def singularize(word: str) -> str:
+    """Very small English singularizer good enough for route segments"""
+    if word.endswith("ies") and len(word) > 3:
+        return word[:-3] + "y"
+    if word.endswith(("ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def route_entity(route: str) -> str:
+    """Return the resource segment a route acts on (e.g. 'vendors' for api/vendors/{id})"""
+    segments = [s for s in route.strip("/").split("/") if s]
+    if segments and segments[0] == "api":
+        segments = segments[1:]
+    for segment in segments:
+        if not _PARAM_RE.fullmatch(segment):
+            return segment
+    return ""
+
+
+def entity_variants(entity: str) -> List[str]:
+    """All spellings of an entity that may appear in titles, descriptions and prose"""
+    if not entity:
+        return []
+    forms = {entity, singularize(entity)}
+    if entity.endswith("s"):
+        forms.add(entity[:-1])
+    variants = set()
+    for form in forms:
+        for spaced in {form, form.replace("-", " "), form.replace("-", "_")}:
+            variants.update({spaced, spaced.capitalize(), spaced.title(), spaced.upper()})
+    # Longest first so 'purchase-orders' wins over 'purchase-order'
+    return sorted(variants, key=len, reverse=True)
+
+
+def route_template(route: str) -> str:
+    """Route with its resource segment and path parameters abstracted away"""
+    entity = route_entity(route)
+    template = _PARAM_RE.sub(PARAM_TOKEN, route)
+    if entity:
+        template = re.sub(rf"(?<![\w-]){re.escape(entity)}(?![\w-])", ENTITY_TOKEN, template, count=1)
+    return template
+
+
+def _replace_words(text: str, words: List[str], replacement: str) -> str:
+    """Replace whole-word occurrences of any of `words` in `text`"""
+    for word in words:
+        text = re.sub(rf"(?<![\w-]){re.escape(word)}(?![\w-])", replacement, text)
+    return text
+
+
+def normalized_text(api: Endpoint) -> str:
+    """Entity-normalized title, description and route used for shingling"""
+    variants = entity_variants(route_entity(api.route))
+    parts = [
+        _replace_words(api.title, variants, ENTITY_TOKEN),
+        _replace_words(api.description, variants, ENTITY_TOKEN),
+        route_template(api.route),
+    ]
+    return " | ".join(parts).lower()
+
+
+def shingles(text: str, size: int = 2) -> set:
+    """Word unigrams plus word n-grams (short catalog strings need both)"""
+    words = _WORD_RE.findall(text)
+    grams = set(words)
+    grams.update(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+    return grams
+
+
+def minhash(grams: set) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set"""
+    if not grams:
+        return tuple([MAX_HASH] * NUM_PERMUTATIONS)
+    hashed = [zlib.crc32(g.encode("utf-8")) for g in grams]
+    return tuple(
+        min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashed)
+        for a, b in PERMUTATIONS
+    )
+
+
+def estimated_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity from two MinHash signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERMUTATIONS
+
+
+def _cluster_key(api: Endpoint) -> Tuple[str, str, str]:
+    """Rows may only share a generation if method, auth and route shape agree"""
+    return (
+        api.method.lower(),
+        api.auth_type,
+        route_template(api.route),
+    )
+
+
+def cluster_endpoints(api_data: List[Endpoint], threshold: float = 0.8) -> List[List[int]]:
+    """Group near-duplicate rows; returns clusters as lists of indexes into api_data"""
+    signatures = [minhash(shingles(normalized_text(api))) for api in api_data]
+    keys = [_cluster_key(api) for api in api_data]
+
+    parent = list(range(len(api_data)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # LSH banding: only rows sharing at least one band are compared
+    for band in range(BANDS):
+        buckets: Dict[Tuple, List[int]] = {}
+        start = band * ROWS_PER_BAND
+        for i, signature in enumerate(signatures):
+            bucket = (keys[i], signature[start:start + ROWS_PER_BAND])
+            buckets.setdefault(bucket, []).append(i)
+        for members in buckets.values():
+            first = members[0]
+            for other in members[1:]:
+                root_a, root_b = find(first), find(other)
+                if root_a == root_b:
+                    continue
+                if estimated_similarity(signatures[first], signatures[other]) >= threshold:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(api_data)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def _substitutions(api: Endpoint) -> List[Tuple[str, bool]]:
+    """Values of a row that get templated out of / filled into generated text, in order"""
+    return [
+        (api.route, False),
+        (api.description, False),
+        (api.title, False),
+        (api.category, True),
+    ]
+
+
+def specialize(generated: Dict[str, str], canonical: Endpoint, target: Endpoint) -> Dict[str, str]:
+    """Rewrite the canonical row's generated issue so it describes the target row"""
+    source_values = _substitutions(canonical)
+    target_values = _substitutions(target)
+    source_entity = route_entity(canonical.route)
+    source_variants = entity_variants(source_entity)
+    target_entity = route_entity(target.route)
+
+    def entity_for(variant: str) -> str:
+        # Keep the plural/singular form, separator and casing of the matched spelling
+        is_plural = variant.lower().replace(" ", "-").replace("_", "-") == source_entity
+        word = target_entity if is_plural else singularize(target_entity)
+        # Capitalized single words are title/prose style: "Order" -> "Service Order"
+        if " " in variant or (variant[:1].isupper() and "-" not in variant and "_" not in variant):
+            word = word.replace("-", " ")
+        elif "_" in variant:
+            word = word.replace("-", "_")
+        if variant.isupper():
+            return word.upper()
+        if variant.istitle():
+            return word.title()
+        if variant[:1].isupper():
+            return word.capitalize()
+        return word
+
+    def rewrite(text: str, scoped: bool) -> str:
+        placeholders = {}
+
+        def loose(segment: str) -> str:
+            # Category names and entity words are ordinary English ("in order to"),
+            # so they are only substituted where `rewrite` allows it
+            for n, ((source, whole_word), (target_value, _)) in enumerate(zip(source_values, target_values)):
+                if whole_word and source and source != target_value:
+                    token = f"\x00{n}\x00"
+                    placeholders[token] = target_value
+                    segment = _replace_words(segment, [source], token)
+            if target_entity:
+                for m, variant in enumerate(source_variants):
+                    token = f"\x00e{m}\x00"
+                    replaced = _replace_words(segment, [variant], token)
+                    if replaced != segment:
+                        placeholders[token] = entity_for(variant)
+                        segment = replaced
+            return segment
+
+        # Exact catalog values (route, description, title) are safe to replace anywhere
+        for n, ((source, whole_word), (target_value, _)) in enumerate(zip(source_values, target_values)):
+            if whole_word or not source or source == target_value:
+                continue
+            token = f"\x00{n}\x00"
+            placeholders[token] = target_value
+            text = text.replace(source, token)
+        if scoped:
+            text = _SPEC_LINE_RE.sub(lambda match: loose(match.group(0)), text)
+        else:
+            text = loose(text)
+        for token, value in placeholders.items():
+            text = text.replace(token, value)
+        return text
+
+    # The title is short and endpoint-specific; in the description only the
+    # "- **Route:** ..." style spec lines are rewritten, never the prose
+    return {
+        "title": rewrite(generated["title"], scoped=False),
+        "description": rewrite(generated["description"], scoped=True),
+    }
+
+
+def canonical_index(clusters: List[List[int]]) -> Dict[int, int]:
+    """Map every row index to the index of its cluster's canonical (first) row"""
+    index: Dict[int, int] = {}
+    for members in clusters:
+        for member in members:
+            index[member] = members[0]
+    return index
+
+
+def describe_clusters(api_data: List[Endpoint], clusters: List[List[int]]) -> Optional[str]:
+    """One-line summary of how much generation work clustering saves"""
+    shared = [members for members in clusters if len(members) > 1]
+    if not shared:
+        return None
+    saved = sum(len(members) - 1 for members in shared)
+    return f"{len(api_data)} endpoints in {len(clusters)} clusters ({len(shared)} shared, {saved} generations saved)"
+
+
+if __name__ == "__main__":
+    def sample(category: str, title: str, route: str) -> Endpoint:
+        return Endpoint(0, category, title, f"{title} by id", route, "put", "Employee", "", "")
+
+    orders = sample("orders", "Update order", "api/orders/{id}")
+    service_orders = sample("services", "Update service order", "api/service-orders/{id}")
+    roles = sample("rbac", "Update role", "api/roles/{id}")
+    purchase_orders = sample("purchasing", "Update purchase order", "api/purchase-orders/{id}")
+
+    checks = [
+        (orders, service_orders, "Implement Update Order API",
+         "## Overview\n\nIn order to keep order totals correct, recalculate on save.\n\n"
+         "- **Route:** api/orders/{id}\n- **Category:** orders",
+         "Implement Update Service Order API",
+         "## Overview\n\nIn order to keep order totals correct, recalculate on save.\n\n"
+         "- **Route:** api/service-orders/{id}\n- **Category:** services"),
+        (roles, purchase_orders, "Implement Update Role API",
+         "## Overview\n\nRoles group permissions; keep the rbac cache warm.\n\n"
+         "- **Route:** api/roles/{id}\n- **Category:** rbac",
+         "Implement Update Purchase Order API",
+         "## Overview\n\nRoles group permissions; keep the rbac cache warm.\n\n"
+         "- **Route:** api/purchase-orders/{id}\n- **Category:** purchasing"),
+    ]
+    failed = 0
+    for canonical, target, title, description, expected_title, expected_description in checks:
+        result = specialize({"title": title, "description": description}, canonical, target)
+        if result != {"title": expected_title, "description": expected_description}:
+            failed += 1
+            print(f"FAIL {canonical.route} -> {target.route}: {result}")
+    if failed:
+        sys.exit(1)
+    print(f"OK ({len(checks)} samples)")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Byte-offset index and random-access reads over enhanced_doc.csv
+
+The enhanced CSV has one row per endpoint but ~21k physical lines, because
+the generated issue descriptions are multi-line quoted fields. A sidecar
+index (<csv>.idx.json) records, for every row, the byte range of the record
+and maps each category to its ids, so selecting a few ids or one category
+only decodes those records from a memory-mapped file instead of parsing the
+whole CSV with pandas.
+
+The index is rebuilt automatically whenever the CSV's size or mtime changes.
+
+Usage:
+    python csv_index.py enhanced_doc.csv
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+from models import GeneratedIssue
+
+INDEX_VERSION = 1
+
+
+def index_path(csv_path: str) -> str:
+    """Sidecar index path for a CSV file"""
+    return f"{csv_path}.idx.json"
+
+
+def _record_spans(data) -> Iterable[tuple]:
+    """Yield (start, end) byte spans of CSV records, honouring quoted newlines"""
+    length = len(data)
+    start = 0
+    position = 0
+    in_quotes = False
+    while position < length:
+        newline = data.find(b"\n", position)
+        if newline == -1:
+            newline = length
+        # mmap has no count(); the slice copy is one line at a time
+        in_quotes ^= data[position:newline].count(b'"') % 2 == 1
+        position = newline + 1
+        if not in_quotes:
+            yield start, min(position, length)
+            start = position
+    if start < length:
+        yield start, length
+
+
+def _parse_record(raw: bytes) -> List[str]:
+    """Parse a single CSV record"""
+    return next(csv.reader(io.StringIO(raw.decode("utf-8"))), [])
+
+
+def build_index(csv_path: str) -> Dict:
+    """Scan the CSV once and write its sidecar index"""
+    stat = os.stat(csv_path)
+    offsets: Dict[str, List[int]] = {}
+    categories: Dict[str, List[int]] = {}
+    header: List[str] = []
+
+    with open(csv_path, "rb") as f:
+        if stat.st_size == 0:
+            spans = []
+            data = b""
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            spans = _record_spans(data)
+        try:
+            for span_start, span_end in spans:
+                if not header:
+                    header = _parse_record(data[span_start:span_end])
+                    id_column = header.index("id")
+                    category_column = header.index("category")
+                    continue
+                fields = _parse_record(data[span_start:span_end])
+                if len(fields) <= max(id_column, category_column):
+                    continue
+                try:
+                    row_id = int(float(fields[id_column]))
+                except ValueError:
+                    continue
+                offsets[str(row_id)] = [span_start, span_end]
+                categories.setdefault(fields[category_column], []).append(row_id)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    index = {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "header": header,
+        "offsets": offsets,
+        "categories": categories,
+    }
+    with open(index_path(csv_path), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    return index
+
+
+def load_index(csv_path: str) -> Dict:
+    """Load the sidecar index, rebuilding it if it is missing or stale"""
+    stat = os.stat(csv_path)
+    try:
+        with open(index_path(csv_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if (index.get("version") == INDEX_VERSION
+                and index.get("size") == stat.st_size
+                and index.get("mtime_ns") == stat.st_mtime_ns):
+            return index
+    except (FileNotFoundError, ValueError):
+        pass
+    return build_index(csv_path)
+
+
+def select_ids(index: Dict, ids: Optional[Iterable[int]] = None, categories: Optional[Iterable[str]] = None) -> List[int]:
+    """Resolve --ids/--category selections to a sorted list of ids present in the index
+
+    When both are given the selection is their intersection (the ids that are
+    in one of the categories).
+    """
+    selected = set(int(i) for i in index["offsets"])
+    if ids:
+        selected &= set(ids)
+    if categories:
+        in_categories = set()
+        for category in categories:
+            in_categories.update(index["categories"].get(category, []))
+        selected &= in_categories
+    return sorted(selected)
+
+
+def read_issues(csv_path: str, index: Dict, ids: Iterable[int]) -> List[GeneratedIssue]:
+    """Decode only the requested rows from a memory-mapped CSV"""
+    header = index["header"]
+    issues = []
+    with open(csv_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for row_id in ids:
+                span = index["offsets"].get(str(row_id))
+                if span is None:
+                    continue
+                fields = _parse_record(data[span[0]:span[1]])
+                issues.append(GeneratedIssue.from_row(dict(zip(header, fields)), row_id))
+    return issues
+
+
+def parse_id_list(value: str) -> List[int]:
+    """Parse '3,7,10-12' into [3, 7, 10, 11, 12]"""
+    ids: List[int] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            low, high = part.split("-", 1)
+            ids.extend(range(int(low), int(high) + 1))
+        else:
+            ids.append(int(part))
+    return ids
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "enhanced_doc.csv"
+    built = build_index(path)
+    print(f"Indexed {len(built['offsets'])} rows in {len(built['categories'])} categories -> {index_path(path)}")
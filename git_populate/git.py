@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Git History Populator for Deshio ERP API Documentation
+
+This script seeds a repository with commit history tied to the generated GitHub
+issues: one commit per endpoint, each adding a stub under endpoints/ and
+referencing the endpoint's issue number from github_issues_log.json.
+
+The whole history is written as a single `git fast-import` stream, so
+thousands of commits land in seconds instead of one porcelain call (or one
+GitPython commit) per endpoint.
+
+Usage:
+    python git.py --repo-path ../../deshio --branch main
+
+Example:
+    # Inspect the stream without touching the repository
+    python git.py --repo-path ../../deshio --dry-run --stream-out history.fi
+
+    # Space commits 45 minutes apart starting on a given date
+    python git.py --repo-path ../../deshio --start-date 2025-01-06T09:00:00 --interval-minutes 45
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from dotenv import load_dotenv
+from colorama import init, Fore, Back, Style
+
+from models import GeneratedIssue, issues_from_frame, load_issue_numbers
+
+# Load environment variables
+load_dotenv()
+
+# Initialize colorama for cross-platform colored output
+init(autoreset=True)
+
+# Color utility functions
+def print_success(message: str):
+    """Print success message in green"""
+    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+
+def print_error(message: str):
+    """Print error message in red"""
+    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+
+def print_warning(message: str):
+    """Print warning message in yellow"""
+    print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+
+def print_info(message: str):
+    """Print info message in blue"""
+    print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+
+def print_header(message: str):
+    """Print header message in cyan with decoration"""
+    separator = "═" * len(message)
+    print(f"\n{Fore.CYAN}{separator}")
+    print(f"{Fore.CYAN}{message}")
+    print(f"{Fore.CYAN}{separator}{Style.RESET_ALL}\n")
+
+
+DEFAULT_INTERVAL_MINUTES = 30
+
+
+def slugify(text: str, max_length: int = 60) -> str:
+    """Lowercase, dash-separated file name fragment"""
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug[:max_length].rstrip("-") or "endpoint"
+
+
+def run_git(repo_path: str, *args: str) -> Optional[str]:
+    """Run a git command in repo_path and return stripped stdout, or None on failure"""
+    result = subprocess.run(
+        ["git", "-C", repo_path, *args],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def load_csv_data(file_path: str) -> List[GeneratedIssue]:
+    """Load enhanced CSV data"""
+    try:
+        print_info(f"Loading CSV data from: {file_path}")
+        df = pd.read_csv(file_path)
+        print_success(f"Successfully loaded {len(df)} records")
+        return issues_from_frame(df)
+    except FileNotFoundError:
+        print_error(f"CSV file '{file_path}' not found")
+        sys.exit(1)
+    except Exception as e:
+        print_error(f"Failed to read CSV file: {e}")
+        sys.exit(1)
+
+
+def endpoint_path(issue: GeneratedIssue) -> str:
+    """Repository path of the stub file committed for an endpoint"""
+    endpoint = issue.endpoint
+    return f"endpoints/{slugify(endpoint.category, 40)}/{endpoint.id:04d}-{slugify(endpoint.title)}.md"
+
+
+def endpoint_stub(issue: GeneratedIssue, issue_number: int) -> str:
+    """Markdown stub describing the endpoint and linking its issue"""
+    endpoint = issue.endpoint
+    return (
+        f"# {issue.title}\n\n"
+        f"- **Route:** `{endpoint.method.upper()} /{endpoint.route}`\n"
+        f"- **Authentication:** {endpoint.auth_type}\n"
+        f"- **Category:** {endpoint.category}\n"
+        f"- **Issue:** #{issue_number}\n\n"
+        f"{endpoint.description}\n"
+    )
+
+
+def commit_message(issue: GeneratedIssue, issue_number: int, keyword: str) -> str:
+    """Commit message referencing the endpoint's issue"""
+    endpoint = issue.endpoint
+    return (
+        f"{issue.title}\n\n"
+        f"{endpoint.method.upper()} /{endpoint.route}\n\n"
+        f"{keyword} #{issue_number}\n"
+    )
+
+
+def _data(payload: bytes) -> bytes:
+    """fast-import `data` command with an exact byte count"""
+    return b"data %d\n%s\n" % (len(payload), payload)
+
+
+def build_fast_import_stream(
+    commits: List[Tuple[GeneratedIssue, int]],
+    branch: str,
+    parent: Optional[str],
+    author: str,
+    start: datetime,
+    interval: timedelta,
+    keyword: str
+) -> bytes:
+    """Build one fast-import stream creating a commit per (issue, issue number) pair"""
+    ref = f"refs/heads/{branch}".encode("utf-8")
+    author_bytes = author.encode("utf-8")
+    parts: List[bytes] = []
+    timestamp = start
+
+    for mark, (issue, issue_number) in enumerate(commits, 1):
+        when = b"%d %s" % (int(timestamp.timestamp()), timestamp.strftime("%z").encode("ascii"))
+        message = commit_message(issue, issue_number, keyword).encode("utf-8")
+        content = endpoint_stub(issue, issue_number).encode("utf-8")
+
+        parts.append(b"commit " + ref + b"\n")
+        parts.append(b"mark :%d\n" % mark)
+        parts.append(b"author " + author_bytes + b" " + when + b"\n")
+        parts.append(b"committer " + author_bytes + b" " + when + b"\n")
+        parts.append(_data(message))
+        if mark == 1 and parent:
+            parts.append(b"from " + parent.encode("ascii") + b"\n")
+        parts.append(b"M 100644 inline " + endpoint_path(issue).encode("utf-8") + b"\n")
+        parts.append(_data(content))
+        timestamp += interval
+
+    parts.append(b"done\n")
+    return b"".join(parts)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Seed a repository with one commit per Deshio ERP endpoint via git fast-import"
+    )
+    parser.add_argument(
+        "--repo-path",
+        default=".",
+        help="Path of the git repository to populate (default: current directory)"
+    )
+    parser.add_argument(
+        "--csv",
+        default="enhanced_doc.csv",
+        help="Input enhanced CSV file path (default: enhanced_doc.csv)"
+    )
+    parser.add_argument(
+        "--issues-log",
+        default="github_issues_log.json",
+        help="Issue creation log mapping ids to issue numbers (default: github_issues_log.json)"
+    )
+    parser.add_argument(
+        "--branch",
+        default="main",
+        help="Branch to append the commits to (default: main)"
+    )
+    parser.add_argument(
+        "--author",
+        help="Commit author as 'Name <email>' (default: git config user.name/user.email)"
+    )
+    parser.add_argument(
+        "--start-date",
+        help="ISO timestamp of the first commit (default: one interval per commit before now, "
+             "or spread between the branch tip and now when appending)"
+    )
+    parser.add_argument(
+        "--interval-minutes",
+        type=float,
+        help=f"Minutes between consecutive commits (default: {DEFAULT_INTERVAL_MINUTES:g}, "
+             "shortened to fit between the branch tip and now when appending)"
+    )
+    parser.add_argument(
+        "--keyword",
+        default="Refs",
+        help="Issue reference keyword, e.g. Refs or Closes (default: Refs)"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Limit number of commits to create (for testing)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Dry run mode - build the stream but don't import it"
+    )
+    parser.add_argument(
+        "--stream-out",
+        help="Also write the fast-import stream to this file"
+    )
+
+    args = parser.parse_args()
+
+    # Print startup header
+    print_header("🚀 Deshio ERP Git History Populator")
+    start_time = datetime.now()
+    print_info(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print_info(f"Repository: {Fore.YELLOW}{os.path.abspath(args.repo_path)}{Style.RESET_ALL}")
+    print_info(f"Branch: {Fore.YELLOW}{args.branch}{Style.RESET_ALL}")
+    print_info(f"CSV file: {Fore.YELLOW}{args.csv}{Style.RESET_ALL}")
+    print_info(f"Issue log: {Fore.YELLOW}{args.issues_log}{Style.RESET_ALL}")
+    print_info(f"Dry run: {Fore.YELLOW}{'Yes' if args.dry_run else 'No'}{Style.RESET_ALL}")
+
+    # Check the target repository
+    if run_git(args.repo_path, "rev-parse", "--git-dir") is None:
+        print_error(f"'{args.repo_path}' is not a git repository")
+        sys.exit(1)
+    parent = run_git(args.repo_path, "rev-parse", "--verify", "--quiet", f"refs/heads/{args.branch}")
+    if parent:
+        print_info(f"Appending to {args.branch} at {parent[:12]}")
+    else:
+        print_info(f"Branch {args.branch} does not exist yet and will be created")
+
+    author = args.author
+    if not author:
+        name = run_git(args.repo_path, "config", "user.name")
+        email = run_git(args.repo_path, "config", "user.email")
+        if not name or not email:
+            print_error("No --author given and git user.name/user.email are not configured")
+            sys.exit(1)
+        author = f"{name} <{email}>"
+    print_info(f"Author: {Fore.YELLOW}{author}{Style.RESET_ALL}")
+
+    # Pair each endpoint with its issue number
+    csv_data = load_csv_data(args.csv)
+    try:
+        issue_numbers = load_issue_numbers(args.issues_log)
+    except FileNotFoundError:
+        print_error(f"Issue log '{args.issues_log}' not found")
+        sys.exit(1)
+    except Exception as e:
+        print_error(f"Failed to read issue log: {e}")
+        sys.exit(1)
+    linked = [(issue, issue_numbers[issue.endpoint.id]) for issue in csv_data if issue.endpoint.id in issue_numbers]
+    unlinked = len(csv_data) - len(linked)
+    if unlinked:
+        print_warning(f"{unlinked} endpoints have no issue number in {args.issues_log} and are skipped")
+
+    # Endpoints committed by an earlier run already have their stub on the branch
+    existing_paths = set()
+    if parent:
+        listing = run_git(args.repo_path, "ls-tree", "-r", "--name-only", parent, "endpoints/")
+        existing_paths = set(listing.splitlines()) if listing else set()
+    commits = [(issue, number) for issue, number in linked if endpoint_path(issue) not in existing_paths]
+    if len(commits) < len(linked):
+        print_info(f"{len(linked) - len(commits)} endpoints are already committed on {args.branch} and are skipped")
+    if args.limit:
+        commits = commits[:args.limit]
+    if not commits:
+        print_warning("Nothing to commit")
+        return
+
+    interval = timedelta(minutes=args.interval_minutes or DEFAULT_INTERVAL_MINUTES)
+    now = datetime.now(timezone.utc).astimezone()
+    if args.start_date:
+        start = datetime.fromisoformat(args.start_date)
+        if start.tzinfo is None:
+            start = start.astimezone()
+    else:
+        start = now - interval * len(commits)
+
+    # Appended history must not predate the commit it builds on
+    if parent:
+        parent_time = datetime.fromtimestamp(int(run_git(args.repo_path, "log", "-1", "--format=%ct", parent)), timezone.utc).astimezone()
+        if start <= parent_time:
+            if args.start_date:
+                print_warning(f"--start-date is not after the tip of {args.branch} ({parent_time.isoformat()}); starting after it instead")
+                start = parent_time + interval
+            elif args.interval_minutes:
+                print_error(f"{len(commits)} commits {args.interval_minutes:g} minutes apart do not fit between the tip of "
+                            f"{args.branch} ({parent_time.isoformat()}) and now; pass a smaller --interval-minutes or a --start-date")
+                sys.exit(1)
+            else:
+                # Spread the new commits evenly between the tip and now
+                interval = (now - parent_time) / (len(commits) + 1)
+                if interval <= timedelta(0):
+                    print_error(f"The tip of {args.branch} is dated in the future ({parent_time.isoformat()}); pass a --start-date")
+                    sys.exit(1)
+                start = parent_time + interval
+                print_info(f"Spacing commits {interval.total_seconds() / 60:.1f} minutes apart to fit between the tip of {args.branch} and now")
+    last = start + interval * (len(commits) - 1)
+    if last > datetime.now(timezone.utc):
+        print_warning(f"The last commit will be dated in the future ({last.isoformat()}); consider a smaller --interval-minutes")
+
+    # Build and import the stream
+    print_header("🔄 Building fast-import Stream")
+    stream = build_fast_import_stream(commits, args.branch, parent, author, start, interval, args.keyword)
+    print_success(f"Stream ready: {len(commits)} commits, {len(stream) / 1024:.1f} KiB")
+
+    if args.stream_out:
+        with open(args.stream_out, 'wb') as f:
+            f.write(stream)
+        print_success(f"Stream written to: {args.stream_out}")
+
+    if args.dry_run:
+        print_info("🧪 Dry run completed - no commits were imported")
+        return
+
+    result = subprocess.run(
+        ["git", "-C", args.repo_path, "fast-import", "--quiet"],
+        input=stream,
+        capture_output=True
+    )
+    if result.returncode != 0:
+        print_error(f"git fast-import failed: {result.stderr.decode('utf-8', 'replace').strip()}")
+        sys.exit(1)
+
+    # Calculate and display summary
+    end_time = datetime.now()
+    duration = end_time - start_time
+    tip = run_git(args.repo_path, "rev-parse", f"refs/heads/{args.branch}") or "?"
+
+    print_header("📊 Summary Report")
+    print_success(f"Commits imported: {len(commits)}")
+    print_success(f"{args.branch} is now at {tip[:12]}")
+    print_info(f"Processing time: {duration.total_seconds():.1f} seconds")
+    if parent and run_git(args.repo_path, "symbolic-ref", "--quiet", "--short", "HEAD") == args.branch:
+        print_warning(f"{args.branch} is checked out; run 'git read-tree -m -u {parent[:12]} HEAD' in the repo to update the working tree")
+
+    print(f"\n{Fore.CYAN}Happy coding! 🚀{Style.RESET_ALL}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ and automatically creates issues in the specified GitHub repository.
 
 Usage:
     python github_issues.py --csv enhanced_doc.csv --repo sakhadib/deshio
+    python github_issues.py --ids 12,40-45 --category payment
+    python github_issues.py --close-implemented --routes ../backend/routes/api.php
 
 Features:
 - Creates GitHub issues with enhanced descriptions including route information
@@ -14,6 +16,11 @@ Features:
 - Handles resume functionality to skip already created issues
 - Provides colored console output with progress tracking
 - Includes rate limiting to respect GitHub API limits
+- Closes or labels issues whose routes the Laravel backend already implements
+  (--close-implemented, matched against backend/routes/api.php)
+- Targeted re-pushes with --ids/--category read only the selected rows through
+  a byte-offset sidecar index (enhanced_doc.csv.idx.json)
+- Optional --profile mode with per-phase timings, pstats and collapsed stacks
 """
 
 import argparse
@@ -21,12 +28,22 @@ import json
 import os
 import sys
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
+
+# Captured before third-party imports so --profile can report their startup cost
+PROCESS_STARTED = time.perf_counter()
+
 import pandas as pd
 import requests
 from dotenv import load_dotenv
 from colorama import init, Fore, Back, Style
 from datetime import datetime
+from models import GeneratedIssue, issues_from_frame, load_issue_numbers
+from csv_index import load_index, parse_id_list, read_issues, select_ids
+from profiling import Profiler
+from progress import MODES as PROGRESS_MODES, ProgressRenderer, emit
+from rate_limiter import SharedRateLimiter, budget_key
+from route_index import RouteIndex
 
 # Load environment variables
 load_dotenv()
@@ -37,19 +54,19 @@ init(autoreset=True)
 # Color utility functions
 def print_success(message: str):
     """Print success message in green"""
-    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
 
 def print_error(message: str):
     """Print error message in red"""
-    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
 
 def print_warning(message: str):
     """Print warning message in yellow"""
-    print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
 
 def print_info(message: str):
     """Print info message in blue"""
-    print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+    emit(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
 
 def print_header(message: str):
     """Print header message in cyan with decoration"""
@@ -58,21 +75,11 @@ def print_header(message: str):
     print(f"{Fore.CYAN}{message}")
     print(f"{Fore.CYAN}{separator}{Style.RESET_ALL}\n")
 
-def print_progress(current: int, total: int, message: str):
-    """Print progress with colored progress bar"""
-    percentage = (current / total) * 100
-    bar_length = 30
-    filled_length = int(bar_length * current // total)
-    bar = f"{Fore.GREEN}{'█' * filled_length}{Fore.WHITE}{'░' * (bar_length - filled_length)}{Style.RESET_ALL}"
-    print(f"\r{Fore.MAGENTA}[{current:3d}/{total:3d}] {bar} {percentage:6.1f}% {Fore.CYAN}{message}{Style.RESET_ALL}", end="", flush=True)
-    if current == total:
-        print()  # New line when complete
-
 
 class GitHubIssueCreator:
     """Client for creating GitHub issues via GitHub API"""
     
-    def __init__(self, token: str, repo: str):
+    def __init__(self, token: str, repo: str, rate_limit_db: Optional[str] = None):
         self.token = token
         self.repo = repo
         self.base_url = "https://api.github.com"
@@ -84,6 +91,44 @@ class GitHubIssueCreator:
         }
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = None
+        # Budget shared with every other run using the same token (see rate_limiter.py)
+        self.rate_limiter = SharedRateLimiter(
+            budget_key("github", token),
+            capacity=5000,
+            window=3600,
+            db_path=rate_limit_db,
+            reserve=10,
+            on_wait=lambda seconds: print_warning(f"Rate limit low, waiting {seconds:.0f} seconds...")
+        )
+    
+    def track_rate_limit(self, response: requests.Response):
+        """Update the shared rate limit state from X-RateLimit-* headers and 403/429 rate limit responses"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self.rate_limit_reset = int(reset)
+        if response.status_code in (403, 429):
+            # Secondary (content creation) limits send Retry-After; primary ones exhaust X-RateLimit-Remaining
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                try:
+                    self.rate_limiter.exhaust(float(retry_after))
+                except ValueError:
+                    self.rate_limiter.exhaust(60.0)
+                return
+            if remaining == '0' and reset is not None:
+                self.rate_limiter.exhaust(max(1.0, float(reset) - time.time()))
+                return
+            if response.status_code == 429:
+                # GitHub asks for at least a minute when no Retry-After is given
+                self.rate_limiter.exhaust(60.0)
+                return
+        self.rate_limiter.update(
+            int(remaining) if remaining is not None else None,
+            float(reset) if reset is not None else None
+        )
     
     def check_rate_limit(self):
         """Check current rate limit status"""
@@ -97,6 +142,7 @@ class GitHubIssueCreator:
                 data = response.json()
                 self.rate_limit_remaining = data['resources']['core']['remaining']
                 self.rate_limit_reset = data['resources']['core']['reset']
+                self.rate_limiter.update(self.rate_limit_remaining, float(self.rate_limit_reset))
                 print_info(f"Rate limit: {self.rate_limit_remaining} requests remaining")
                 return True
         except Exception as e:
@@ -104,13 +150,8 @@ class GitHubIssueCreator:
         return False
     
     def wait_for_rate_limit(self):
-        """Wait if rate limit is low"""
-        if self.rate_limit_remaining < 10:
-            if self.rate_limit_reset:
-                wait_time = max(60, self.rate_limit_reset - int(time.time()) + 10)
-                print_warning(f"Rate limit low, waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-                self.check_rate_limit()
+        """Reserve one request from the shared budget, waiting if it is low"""
+        self.rate_limiter.acquire()
     
     def enhance_description_with_route(self, description: str, route: str, method: str, auth_type: str) -> str:
         """Enhance description by adding route information prominently"""
@@ -195,8 +236,7 @@ class GitHubIssueCreator:
             )
             
             # Update rate limit info from headers
-            if 'X-RateLimit-Remaining' in response.headers:
-                self.rate_limit_remaining = int(response.headers['X-RateLimit-Remaining'])
+            self.track_rate_limit(response)
             
             response.raise_for_status()
             
@@ -213,21 +253,59 @@ class GitHubIssueCreator:
                 print_error(f"Response: {e.response.text}")
             return None
     
-    def get_existing_issues(self) -> Set[str]:
-        """Get existing issue titles to avoid duplicates"""
-        existing_titles = set()
+    def update_issue(self, number: int, state: Optional[str] = None, labels: Optional[List[str]] = None) -> bool:
+        """Close an issue and/or add labels to it"""
+        
+        self.wait_for_rate_limit()
+        
+        try:
+            if state:
+                response = requests.patch(
+                    f"{self.base_url}/repos/{self.repo}/issues/{number}",
+                    headers=self.headers,
+                    json={"state": state, "state_reason": "completed" if state == "closed" else None},
+                    timeout=30
+                )
+                self.track_rate_limit(response)
+                response.raise_for_status()
+            
+            if labels:
+                if state:
+                    self.wait_for_rate_limit()
+                response = requests.post(
+                    f"{self.base_url}/repos/{self.repo}/issues/{number}/labels",
+                    headers=self.headers,
+                    json={"labels": labels},
+                    timeout=30
+                )
+                self.track_rate_limit(response)
+                response.raise_for_status()
+            
+            return True
+            
+        except requests.exceptions.RequestException as e:
+            print_error(f"Failed to update issue #{number}: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                print_error(f"Response: {e.response.text}")
+            return False
+    
+    def get_existing_issues(self) -> Dict[str, Dict]:
+        """Map existing issue titles to their number, URL, state and labels (to avoid duplicates)"""
+        existing_issues: Dict[str, Dict] = {}
         page = 1
         
         print_info("Fetching existing issues to avoid duplicates...")
         
         while True:
             try:
+                self.wait_for_rate_limit()
                 response = requests.get(
                     f"{self.base_url}/repos/{self.repo}/issues",
                     headers=self.headers,
                     params={"state": "all", "per_page": 100, "page": page},
                     timeout=30
                 )
+                self.track_rate_limit(response)
                 response.raise_for_status()
                 
                 issues = response.json()
@@ -235,7 +313,18 @@ class GitHubIssueCreator:
                     break
                 
                 for issue in issues:
-                    existing_titles.add(issue["title"])
+                    # The issues endpoint also lists pull requests
+                    if "pull_request" in issue:
+                        continue
+                    known = existing_issues.get(issue["title"])
+                    # Keep the oldest issue when a title was created twice
+                    if known is None or issue["number"] < known["number"]:
+                        existing_issues[issue["title"]] = {
+                            "number": issue["number"],
+                            "url": issue["html_url"],
+                            "state": issue["state"],
+                            "labels": {label["name"] for label in issue.get("labels", [])}
+                        }
                 
                 page += 1
                 
@@ -246,11 +335,11 @@ class GitHubIssueCreator:
                 print_warning(f"Could not fetch existing issues: {e}")
                 break
         
-        print_info(f"Found {len(existing_titles)} existing issues")
-        return existing_titles
+        print_info(f"Found {len(existing_issues)} existing issues")
+        return existing_issues
 
 
-def load_csv_data(file_path: str) -> List[Dict]:
+def load_csv_data(file_path: str) -> List[GeneratedIssue]:
     """Load enhanced CSV data"""
     try:
         print_info(f"Loading CSV data from: {file_path}")
@@ -260,7 +349,27 @@ def load_csv_data(file_path: str) -> List[Dict]:
         df = df[df['issue_title'].str.strip() != '']
         df = df[df['issue_description'].str.strip() != '']
         print_success(f"Successfully loaded {len(df)} valid records")
-        return df.to_dict('records')
+        return issues_from_frame(df)
+    except FileNotFoundError:
+        print_error(f"CSV file '{file_path}' not found")
+        sys.exit(1)
+    except Exception as e:
+        print_error(f"Failed to read CSV file: {e}")
+        sys.exit(1)
+
+
+def load_selected_rows(file_path: str, ids: Optional[str], categories: Optional[List[str]]) -> List[GeneratedIssue]:
+    """Load only the rows selected by --ids/--category using the sidecar offset index"""
+    try:
+        print_info(f"Loading selected rows from: {file_path}")
+        index = load_index(file_path)
+        selected = select_ids(index, parse_id_list(ids) if ids else None, categories)
+        issues = [
+            issue for issue in read_issues(file_path, index, selected)
+            if issue.title and issue.description
+        ]
+        print_success(f"Successfully loaded {len(issues)} valid records (of {len(index['offsets'])} indexed)")
+        return issues
     except FileNotFoundError:
         print_error(f"CSV file '{file_path}' not found")
         sys.exit(1)
@@ -269,6 +378,13 @@ def load_csv_data(file_path: str) -> List[Dict]:
         sys.exit(1)
 
 
+def load_issues(args) -> List[GeneratedIssue]:
+    """Load the whole CSV, or only the --ids/--category selection when given"""
+    if args.ids or args.category:
+        return load_selected_rows(args.csv, args.ids, args.category)
+    return load_csv_data(args.csv)
+
+
 def save_results_log(results: List[Dict], output_path: str):
     """Save results to a log file"""
     try:
@@ -279,6 +395,126 @@ def save_results_log(results: List[Dict], output_path: str):
         print_error(f"Failed to save results: {e}")
 
 
+def merge_results_log(results: List[Dict], output_path: str):
+    """Merge a partial (--ids/--category) run into an existing log by endpoint id
+
+    Rows outside the selection are kept as they are. A selected row that did not
+    get an issue number this time (dry run, failure) keeps the one already logged,
+    so git.py and --close-implemented can still find its issue.
+    """
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        entries = []
+    except Exception as e:
+        print_error(f"Could not read existing log '{output_path}' to merge into: {e}")
+        print_warning("Leaving it untouched; rerun with --output to write this selection elsewhere")
+        return
+    
+    position = {entry.get('id'): i for i, entry in enumerate(entries)}
+    for result in results:
+        i = position.get(result['id'])
+        if i is None:
+            position[result['id']] = len(entries)
+            entries.append(result)
+            continue
+        previous = entries[i]
+        if result.get('issue_number') is None and previous.get('issue_number') is not None:
+            result = {**result, 'issue_number': previous['issue_number']}
+            if previous.get('issue_url'):
+                result['issue_url'] = previous['issue_url']
+        entries[i] = result
+    save_results_log(entries, output_path)
+
+
+def close_implemented_issues(client: GitHubIssueCreator, args, profiler: Profiler) -> List[Dict]:
+    """Close or label the issues of every endpoint the backend routes already implement"""
+    with profiler.phase("index"):
+        try:
+            index = RouteIndex.from_file(args.routes)
+        except FileNotFoundError:
+            print_error(f"Routes file '{args.routes}' not found")
+            sys.exit(1)
+    print_success(f"Indexed {index.size} backend routes from {args.routes}")
+    
+    with profiler.phase("load"):
+        csv_data = load_issues(args)
+        try:
+            issue_numbers = load_issue_numbers(args.issues_log)
+        except FileNotFoundError:
+            print_error(f"Issue log '{args.issues_log}' not found")
+            sys.exit(1)
+        except Exception as e:
+            print_error(f"Failed to read issue log: {e}")
+            sys.exit(1)
+    
+    with profiler.phase("match"):
+        implemented = [issue for issue in csv_data if index.match(issue.endpoint.method, issue.endpoint.route)]
+    print_success(f"Implemented endpoints: {len(implemented)}/{len(csv_data)}")
+    
+    targets = [issue for issue in implemented if issue.endpoint.id in issue_numbers]
+    missing = len(implemented) - len(targets)
+    if missing:
+        print_warning(f"{missing} implemented endpoints have no issue number in {args.issues_log}")
+    if args.limit:
+        targets = targets[:args.limit]
+    
+    # One paginated listing tells which issues are already closed/labeled, saving a PATCH each
+    with profiler.phase("fetch state"):
+        current = {issue["number"]: issue for issue in client.get_existing_issues().values()}
+    
+    action = "closed" if args.close_action == "close" else "labeled"
+    print_header(f"🔒 {'Closing' if args.close_action == 'close' else 'Labeling'} Implemented Issues")
+    results = []
+    with ProgressRenderer(len(targets), args.progress, "close_implemented", args.progress_file) as progress:
+        for start in range(0, len(targets), args.batch_size):
+            batch = targets[start:start + args.batch_size]
+            for offset, issue in enumerate(batch, start + 1):
+                number = issue_numbers[issue.endpoint.id]
+                progress.update(offset, f"#{number} {issue.endpoint.method.upper()} {issue.endpoint.route}"[:60])
+                # Only send what is still missing (unknown issues get both)
+                known = current.get(number)
+                state = "closed" if args.close_action == "close" and (known is None or known["state"] != "closed") else None
+                labels = [args.implemented_label] if known is None or args.implemented_label not in known["labels"] else None
+                if not state and not labels:
+                    status = "unchanged"
+                elif args.dry_run:
+                    status = "dry_run"
+                else:
+                    with profiler.phase("update"):
+                        ok = client.update_issue(number, state=state, labels=labels)
+                    status = action if ok else "failed"
+                progress.update(offset, f"#{number} {status}", status)
+                results.append({
+                    "id": issue.endpoint.id,
+                    "issue_number": number,
+                    "status": status,
+                    "route": issue.endpoint.route,
+                    "method": issue.endpoint.method
+                })
+            # Pause between batches to stay clear of GitHub's secondary rate limits
+            if not args.dry_run and start + args.batch_size < len(targets):
+                with profiler.phase("throttle"):
+                    time.sleep(args.batch_delay)
+    
+    print()
+    return results
+
+
+def report_profile(profiler: Profiler):
+    """Print the per-phase breakdown and where the profiling output was written"""
+    paths = profiler.stop()
+    if not paths:
+        return
+    print_header("⏱️ Profile")
+    for line in profiler.phase_report():
+        print_info(line)
+    print_success(f"pstats: {paths['pstats']}")
+    print_success(f"Collapsed stacks (flamegraph): {paths['collapsed']}")
+    print_success(f"Report: {paths['report']}")
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -297,7 +533,7 @@ def main():
     parser.add_argument(
         "--output",
         default="github_issues_log.json",
-        help="Output log file for created issues (default: github_issues_log.json)"
+        help="Output log file for created issues; --ids/--category runs merge into it by id (default: github_issues_log.json)"
     )
     parser.add_argument(
         "--skip-existing",
@@ -314,8 +550,84 @@ def main():
         type=int,
         help="Limit number of issues to create (for testing)"
     )
+    parser.add_argument(
+        "--ids",
+        help="Only process these row ids, e.g. 3,7,10-12; combined with --category, "
+             "only ids in those categories (uses the sidecar offset index)"
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        help="Only process rows in this category; may be repeated (uses the sidecar offset index)"
+    )
+    parser.add_argument(
+        "--progress",
+        choices=PROGRESS_MODES,
+        default="auto",
+        help="Progress output: redrawn bar (tty), periodic summaries (line), JSON events (json) or off; "
+             "auto uses tty on terminals and line otherwise (default: auto)"
+    )
+    parser.add_argument(
+        "--progress-file",
+        help="Append --progress json events to this file instead of stderr"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record cProfile stats, per-phase timings and a collapsed-stack file"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profile",
+        help="Directory for profiling output (default: profile)"
+    )
+    parser.add_argument(
+        "--rate-limit-db",
+        help="SQLite file holding rate limit state shared by concurrent runs "
+             "(default: $DESHIO_RATE_LIMIT_DB or ~/.cache/deshio-erp/rate_limits.sqlite3)"
+    )
+    parser.add_argument(
+        "--close-implemented",
+        action="store_true",
+        help="Close/label issues whose route is implemented in the Laravel routes file instead of creating issues"
+    )
+    parser.add_argument(
+        "--routes",
+        default="../backend/routes/api.php",
+        help="Laravel routes file for --close-implemented (default: ../backend/routes/api.php)"
+    )
+    parser.add_argument(
+        "--issues-log",
+        default="github_issues_log.json",
+        help="Issue creation log mapping ids to issue numbers (default: github_issues_log.json)"
+    )
+    parser.add_argument(
+        "--close-action",
+        choices=["close", "label"],
+        default="close",
+        help="Close implemented issues or only label them (default: close)"
+    )
+    parser.add_argument(
+        "--implemented-label",
+        default="implemented",
+        help="Label added to implemented issues (default: implemented)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=20,
+        help="Issues updated per batch for --close-implemented (default: 20)"
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=2.0,
+        help="Seconds to wait between batches for --close-implemented (default: 2.0)"
+    )
     
     args = parser.parse_args()
+    profiler = Profiler(args.profile, "github_issues", args.profile_dir)
+    profiler.start(PROCESS_STARTED)
     
     # Print startup header
     print_header("🚀 Deshio ERP GitHub Issue Creator")
@@ -328,6 +640,8 @@ def main():
     print_info(f"Dry run: {Fore.YELLOW}{'Yes' if args.dry_run else 'No'}{Style.RESET_ALL}")
     if args.limit:
         print_info(f"Limit: {Fore.YELLOW}{args.limit}{Style.RESET_ALL}")
+    if args.ids or args.category:
+        print_info(f"Selection: {Fore.YELLOW}ids={args.ids or '-'} categories={','.join(args.category or []) or '-'}{Style.RESET_ALL}")
     
     # Check for GitHub token
     github_token = os.getenv("GITHUB_TOKEN")
@@ -340,24 +654,45 @@ def main():
     
     # Initialize GitHub client
     print_info("Initializing GitHub API client...")
-    client = GitHubIssueCreator(github_token, args.repo)
+    client = GitHubIssueCreator(github_token, args.repo, args.rate_limit_db)
     
     # Check rate limit
     if not client.check_rate_limit():
         print_warning("Could not verify rate limit, proceeding anyway...")
     
+    if args.close_implemented:
+        results = close_implemented_issues(client, args, profiler)
+        output = args.output if args.output != args.issues_log else "github_close_log.json"
+        with profiler.phase("write"):
+            save_results_log(results, output)
+        print_header("📊 Summary Report")
+        for status in ("closed", "labeled", "unchanged", "dry_run", "failed"):
+            count = sum(1 for result in results if result["status"] == status)
+            if count:
+                (print_warning if status == "failed" else print_success)(f"{status}: {count}")
+        print_info(f"Processing time: {(datetime.now() - start_time).total_seconds():.1f} seconds")
+        report_profile(profiler)
+        return
+    
     # Load CSV data
-    csv_data = load_csv_data(args.csv)
+    with profiler.phase("load"):
+        csv_data = load_issues(args)
     
     # Apply limit if specified
     if args.limit:
         csv_data = csv_data[:args.limit]
         print_info(f"Limited to {len(csv_data)} issues")
     
+    if not csv_data:
+        print_warning("No issues to process (empty CSV or no rows match --ids/--category)")
+        report_profile(profiler)
+        return
+    
     # Get existing issues if needed
-    existing_issues = set()
+    existing_issues: Dict[str, Dict] = {}
     if args.skip_existing:
-        existing_issues = client.get_existing_issues()
+        with profiler.phase("resume scan"):
+            existing_issues = client.get_existing_issues()
     
     # Process each CSV row
     print_header("🔄 Creating GitHub Issues")
@@ -366,85 +701,98 @@ def main():
     failed_count = 0
     skipped_count = 0
     
-    for i, row in enumerate(csv_data, 1):
-        # Extract data
-        issue_title = str(row.get('issue_title', '')).strip()
-        issue_description = str(row.get('issue_description', '')).strip()
-        route = str(row.get('route', '')).strip()
-        method = str(row.get('Type', '')).strip()
-        category = str(row.get('category', '')).strip()
-        auth_type = str(row.get('Authentication_Type', '')).strip()
-        
-        # Skip if already exists
-        if args.skip_existing and issue_title in existing_issues:
-            skipped_count += 1
-            print_progress(i, len(csv_data), f"⏭️ SKIPPED: {issue_title[:50]}...")
-            results.append({
-                "id": row.get('id'),
-                "title": issue_title,
-                "status": "skipped",
-                "reason": "already exists"
-            })
-            continue
-        
-        # Show progress
-        print_progress(i, len(csv_data), f"🔄 {category} - {issue_title[:40]}...")
-        
-        if args.dry_run:
-            print_progress(i, len(csv_data), f"🧪 DRY RUN: {issue_title[:40]}...")
-            results.append({
-                "id": row.get('id'),
-                "title": issue_title,
-                "status": "dry_run",
-                "would_create": True
-            })
-            success_count += 1
-            continue
-        
-        # Enhance description with route information
-        enhanced_description = client.enhance_description_with_route(
-            issue_description, route, method, auth_type
-        )
-        
-        # Generate labels
-        labels = client.generate_labels(category, method, auth_type)
-        
-        # Create issue
-        issue_result = client.create_issue(issue_title, enhanced_description, labels)
-        
-        if issue_result:
-            success_count += 1
-            print_progress(i, len(csv_data), f"✅ CREATED: #{issue_result['number']} - {issue_title[:30]}...")
-            results.append({
-                "id": row.get('id'),
-                "title": issue_title,
-                "status": "created",
-                "issue_number": issue_result["number"],
-                "issue_url": issue_result["url"],
-                "labels": labels,
-                "route": route,
-                "method": method,
-                "category": category
-            })
-        else:
-            failed_count += 1
-            print_progress(i, len(csv_data), f"❌ FAILED: {issue_title[:40]}...")
-            results.append({
-                "id": row.get('id'),
-                "title": issue_title,
-                "status": "failed",
-                "route": route,
-                "method": method,
-                "category": category
-            })
-        
-        # Small delay to be respectful to GitHub API
-        time.sleep(0.2)
+    # Rows only publish events; the renderer thread owns the terminal
+    with ProgressRenderer(len(csv_data), args.progress, "github_issues", args.progress_file) as progress:
+        for i, issue in enumerate(csv_data, 1):
+            # Extract data
+            endpoint = issue.endpoint
+            issue_title = issue.title
+            issue_description = issue.description
+            route = endpoint.route
+            method = endpoint.method
+            category = endpoint.category
+            auth_type = endpoint.auth_type
+            
+            # Skip if already exists
+            if args.skip_existing and issue_title in existing_issues:
+                skipped_count += 1
+                progress.update(i, f"⏭️ SKIPPED: {issue_title[:50]}...", "skipped")
+                results.append({
+                    "id": endpoint.id,
+                    "title": issue_title,
+                    "status": "skipped",
+                    "reason": "already exists",
+                    # Keep the id -> issue number link for git.py and --close-implemented
+                    "issue_number": existing_issues[issue_title]["number"],
+                    "issue_url": existing_issues[issue_title]["url"]
+                })
+                continue
+            
+            # Show progress
+            progress.update(i, f"🔄 {category} - {issue_title[:40]}...")
+            
+            if args.dry_run:
+                progress.update(i, f"🧪 DRY RUN: {issue_title[:40]}...", "dry_run")
+                results.append({
+                    "id": endpoint.id,
+                    "title": issue_title,
+                    "status": "dry_run",
+                    "would_create": True
+                })
+                success_count += 1
+                continue
+            
+            # Enhance description with route information
+            enhanced_description = client.enhance_description_with_route(
+                issue_description, route, method, auth_type
+            )
+            
+            # Generate labels
+            labels = client.generate_labels(category, method, auth_type)
+            
+            # Create issue
+            with profiler.phase("create"):
+                issue_result = client.create_issue(issue_title, enhanced_description, labels)
+            
+            if issue_result:
+                success_count += 1
+                progress.update(i, f"✅ CREATED: #{issue_result['number']} - {issue_title[:30]}...", "created")
+                results.append({
+                    "id": endpoint.id,
+                    "title": issue_title,
+                    "status": "created",
+                    "issue_number": issue_result["number"],
+                    "issue_url": issue_result["url"],
+                    "labels": labels,
+                    "route": route,
+                    "method": method,
+                    "category": category
+                })
+            else:
+                failed_count += 1
+                progress.update(i, f"❌ FAILED: {issue_title[:40]}...", "failed")
+                results.append({
+                    "id": endpoint.id,
+                    "title": issue_title,
+                    "status": "failed",
+                    "route": route,
+                    "method": method,
+                    "category": category
+                })
+            
+            # Small delay to be respectful to GitHub API
+            with profiler.phase("throttle"):
+                time.sleep(0.2)
     
-    print("\n")
+    print()
     
     # Save results
-    save_results_log(results, args.output)
+    with profiler.phase("write"):
+        if args.ids or args.category:
+            # A targeted re-push must not drop the rest of the id -> issue number log
+            merge_results_log(results, args.output)
+        else:
+            save_results_log(results, args.output)
     
     # Calculate and display summary
     end_time = datetime.now()
@@ -471,6 +819,8 @@ def main():
     else:
         print_info("🧪 Dry run completed - no issues were actually created")
     
+    report_profile(profiler)
+    
     print(f"\n{Fore.CYAN}Happy coding! 🚀{Style.RESET_ALL}")
 
 
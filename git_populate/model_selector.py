@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-endpoint model selection for build.py
+
+Every generation records the model's latency, outcome (ok / failed request /
+parse or validation error), token usage and cost (when the provider reports
+it) per category in a JSON metrics file, so the history accumulates across
+runs. With --auto-model, build.py asks the selector for each row:
+
+- candidates come from --models, ordered from cheapest/fastest to strongest
+- a model is acceptable for a category when its estimated success rate
+  (Beta(1, 1) prior) is at least --min-success
+- a model is explored until it has enough observations for that estimate
+  to reach --min-success (8 at 0.9), unless its failures so far already
+  rule that out
+- the fastest acceptable model wins (ties broken by cost, then tokens),
+  with a small epsilon of random exploration so stale estimates get
+  refreshed
+- after a parse/validation failure the row is escalated to the next
+  stronger model in the ladder
+
+Usage (self-check against simulated models):
+    python model_selector.py
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+MIN_SAMPLES = 3
+SAVE_EVERY = 10
+
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"
+OUTCOME_PARSE_ERROR = "parse_error"
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {"calls": 0, "ok": 0, "failed": 0, "parse_errors": 0, "latency": 0.0, "tokens": 0, "cost": 0.0}
+
+
+def _add_metrics(into: Dict, delta: Dict):
+    """Add per model/category counters from `delta` into `into`"""
+    for model, categories in delta.items():
+        for category, stats in categories.items():
+            target = into.setdefault(model, {}).setdefault(category, _empty_stats())
+            for key, value in stats.items():
+                target[key] = target.get(key, 0) + value
+
+
+class ModelSelector:
+    """Bandit-style model choice from historical per-category metrics"""
+
+    def __init__(
+        self,
+        models: List[str],
+        metrics_path: str = "model_metrics.json",
+        min_success: float = 0.9,
+        exploration: float = 0.05,
+        seed: Optional[int] = None,
+        on_warning: Optional[Callable[[str], None]] = None
+    ):
+        self.models = models
+        self.metrics_path = metrics_path
+        self.min_success = min_success
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.on_warning = on_warning
+        self._warned = False
+        # History on disk plus this run's observations; _pending holds only the latter
+        self.metrics: Dict[str, Dict[str, Dict[str, float]]] = self._load()
+        self._pending: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._unsaved = 0
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Read the metrics file; a missing or unreadable file counts as no history"""
+        try:
+            with open(self.metrics_path, "r", encoding="utf-8") as f:
+                metrics = json.load(f)
+            if not isinstance(metrics, dict):
+                raise ValueError("expected a JSON object")
+            return metrics
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            if self.on_warning and not self._warned:
+                self._warned = True
+                self.on_warning(f"Ignoring unreadable model metrics '{self.metrics_path}' ({e}); starting with no history")
+            return {}
+
+    def required_samples(self) -> int:
+        """Observations a never-failing model needs before its estimate reaches min_success"""
+        if self.min_success >= 1:
+            return MIN_SAMPLES
+        # (n + 1) / (n + 2) >= p  <=>  n >= (2p - 1) / (1 - p)
+        return max(MIN_SAMPLES, math.ceil((2 * self.min_success - 1) / (1 - self.min_success) - 1e-9))
+
+    def stats(self, model: str, category: str) -> Dict[str, float]:
+        """Category stats, or the model's totals when the category is too sparse"""
+        per_category = self.metrics.get(model, {})
+        stats = per_category.get(category)
+        if stats and stats["calls"] >= self.required_samples():
+            return stats
+        totals = _empty_stats()
+        for category_stats in per_category.values():
+            for key in totals:
+                totals[key] += category_stats.get(key, 0)
+        return totals
+
+    def success_rate(self, stats: Dict[str, float]) -> float:
+        """Posterior mean success rate with a uniform prior"""
+        return (stats["ok"] + 1) / (stats["calls"] + 2)
+
+    def choose(self, category: str, start: int = 0) -> str:
+        """Pick the fastest acceptable model at or above ladder position `start`"""
+        candidates = self.models[start:] or self.models[-1:]
+        if len(candidates) > 1 and self.random.random() < self.exploration:
+            return self.random.choice(candidates)
+
+        required = self.required_samples()
+        ranked = []
+        for position, model in enumerate(candidates):
+            stats = self.stats(model, category)
+            if stats["calls"] < required:
+                # Explore while all-successful remaining samples could still reach the bar
+                best_case = (stats["ok"] + required - stats["calls"] + 1) / (required + 2)
+                if best_case >= self.min_success:
+                    # Models still being explored are tried first, cheapest first
+                    ranked.append((0, 0.0, 0.0, 0.0, position, model))
+                continue
+            if self.success_rate(stats) < self.min_success:
+                continue
+            calls = stats["calls"]
+            ranked.append((1, stats["latency"] / calls, stats["cost"] / calls, stats["tokens"] / calls, position, model))
+
+        if not ranked:
+            # Nothing meets the bar: use the strongest model
+            return candidates[-1]
+        return min(ranked)[-1]
+
+    def escalate(self, model: str) -> Optional[str]:
+        """Next stronger model in the ladder, or None if `model` is the strongest"""
+        try:
+            position = self.models.index(model)
+        except ValueError:
+            return None
+        if position + 1 < len(self.models):
+            return self.models[position + 1]
+        return None
+
+    def record(self, model: str, category: str, latency: float, outcome: str, tokens: int = 0, cost: float = 0.0):
+        """Add one observation to the metrics history"""
+        observation = _empty_stats()
+        observation["calls"] = 1
+        observation["latency"] = latency
+        observation["tokens"] = tokens
+        observation["cost"] = cost
+        if outcome == OUTCOME_OK:
+            observation["ok"] = 1
+        elif outcome == OUTCOME_PARSE_ERROR:
+            observation["parse_errors"] = 1
+        else:
+            observation["failed"] = 1
+        delta = {model: {category: observation}}
+        _add_metrics(self.metrics, delta)
+        _add_metrics(self._pending, delta)
+        self._unsaved += 1
+        if self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    def save(self):
+        """Merge this run's observations into the file on disk and replace it atomically
+
+        Re-reading first keeps the history written meanwhile by concurrent runs;
+        the temp file + os.replace means a crash never leaves a truncated file.
+        """
+        if not self._pending:
+            return
+        metrics = self._load()
+        _add_metrics(metrics, self._pending)
+        directory = os.path.dirname(os.path.abspath(self.metrics_path))
+        fd, temp_path = tempfile.mkstemp(prefix=".model_metrics.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(metrics, f, indent=2)
+            os.replace(temp_path, self.metrics_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self.metrics = metrics
+        self._pending = {}
+        self._unsaved = 0
+
+    def summary(self) -> List[str]:
+        """One line per model: calls, success rate, mean latency, tokens and cost"""
+        lines = []
+        for model in self.models:
+            stats = self.stats(model, "")
+            if not stats["calls"]:
+                lines.append(f"{model}: no history")
+                continue
+            lines.append(
+                f"{model}: {int(stats['calls'])} calls, "
+                f"{stats['ok'] / stats['calls'] * 100:.0f}% ok, "
+                f"{stats['latency'] / stats['calls']:.1f}s avg, "
+                f"{stats['tokens'] / stats['calls']:.0f} tokens avg, "
+                f"${stats['cost']:.4f} total cost"
+            )
+        return lines
+
+
+def simulate(latencies: Dict[str, float], failure_rates: Dict[str, float], rows: int = 290,
+             seed: int = 0, **options) -> Dict[str, int]:
+    """Run the selector against synthetic models and count how often each was picked"""
+    rng = random.Random(seed)
+    picks = {model: 0 for model in latencies}
+    with tempfile.TemporaryDirectory() as directory:
+        selector = ModelSelector(list(latencies), os.path.join(directory, "metrics.json"), seed=seed, **options)
+        for _ in range(rows):
+            model = selector.choose("orders")
+            picks[model] += 1
+            outcome = OUTCOME_PARSE_ERROR if rng.random() < failure_rates.get(model, 0.0) else OUTCOME_OK
+            selector.record(model, "orders", latencies[model], outcome)
+    return picks
+
+
+if __name__ == "__main__":
+    # Self-check: models that never fail must converge on the fastest one
+    picks = simulate({"cheap": 1.0, "mid": 3.0, "strong": 10.0}, {})
+    print(f"All models reliable: {picks}")
+    if max(picks, key=picks.get) != "cheap":
+        sys.exit("FAIL: the fastest never-failing model was not the usual pick")
+
+    # ...and a fast but unreliable model must be passed over for the next one
+    picks = simulate({"cheap": 1.0, "mid": 3.0, "strong": 10.0}, {"cheap": 0.5})
+    print(f"Cheap model fails half the time: {picks}")
+    if max(picks, key=picks.get) != "mid":
+        sys.exit("FAIL: an unreliable model was still preferred")
+    print("OK")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Typed records shared by build.py, github_issues.py and git.py
+
+Catalog rows are parsed once into compact __slots__ records instead of being
+passed around as pandas `to_dict('records')` dicts. The CSV column names
+(mixed-case, e.g. `Type` and `Authentication_Type`) are only spelled out here.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Dict, List
+
+# The two mixed-case catalog columns (catalog.py maps other schemas onto them)
+METHOD_COLUMN = 'Type'
+AUTH_COLUMN = 'Authentication_Type'
+
+ENDPOINT_FIELDS = ['id', 'category', 'api_title', 'api_description', 'route', METHOD_COLUMN, AUTH_COLUMN]
+ISSUE_FIELDS = ENDPOINT_FIELDS + ['issue_title', 'issue_description']
+
+
+def _cell(value) -> str:
+    """Convert a CSV cell to a stripped string (NaN becomes 'nan', as before)"""
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _optional_cell(value) -> str:
+    """Like _cell, but missing values (None/NaN) become ''"""
+    if value is None or value != value:
+        return ''
+    return str(value).strip()
+
+
+@dataclass
+class Endpoint:
+    """One API endpoint from the catalog"""
+    __slots__ = ('id', 'category', 'title', 'description', 'route', 'method', 'auth_type',
+                 'request_fields', 'response_fields')
+
+    id: int
+    category: str
+    title: str
+    description: str
+    route: str
+    method: str
+    auth_type: str
+    # JSON field sketches; only the api/ catalogs carry them, '' otherwise
+    request_fields: str
+    response_fields: str
+
+    @classmethod
+    def from_row(cls, row: Dict, default_id: int = 0) -> 'Endpoint':
+        """Parse a catalog row (CSV column names) into an Endpoint"""
+        raw_id = row.get('id')
+        try:
+            endpoint_id = int(raw_id)
+        except (TypeError, ValueError):
+            endpoint_id = default_id
+        return cls(
+            id=endpoint_id,
+            category=_cell(row.get('category')),
+            title=_cell(row.get('api_title')),
+            description=_cell(row.get('api_description')),
+            route=_cell(row.get('route')),
+            method=_cell(row.get(METHOD_COLUMN)),
+            auth_type=_cell(row.get(AUTH_COLUMN)),
+            request_fields=_optional_cell(row.get('req_fields')),
+            response_fields=_optional_cell(row.get('res_fields')),
+        )
+
+    def to_row(self) -> Dict[str, object]:
+        """Catalog row using the CSV column names"""
+        return {
+            'id': self.id,
+            'category': self.category,
+            'api_title': self.title,
+            'api_description': self.description,
+            'route': self.route,
+            METHOD_COLUMN: self.method,
+            AUTH_COLUMN: self.auth_type,
+        }
+
+
+@dataclass
+class GeneratedIssue:
+    """An endpoint together with its generated GitHub issue"""
+    __slots__ = ('endpoint', 'title', 'description')
+
+    endpoint: Endpoint
+    title: str
+    description: str
+
+    @classmethod
+    def from_row(cls, row: Dict, default_id: int = 0) -> 'GeneratedIssue':
+        """Parse an enhanced CSV row into a GeneratedIssue"""
+        return cls(
+            endpoint=Endpoint.from_row(row, default_id),
+            title=_cell(row.get('issue_title')),
+            description=_cell(row.get('issue_description')),
+        )
+
+    def to_row(self) -> Dict[str, object]:
+        """Enhanced CSV row using the CSV column names"""
+        row = self.endpoint.to_row()
+        row['issue_title'] = self.title
+        row['issue_description'] = self.description
+        return row
+
+
+def endpoints_from_frame(df) -> List[Endpoint]:
+    """Parse every row of a catalog DataFrame into Endpoints (ids default to 1-based position)"""
+    columns = list(df.columns)
+    return [
+        Endpoint.from_row(dict(zip(columns, values)), position)
+        for position, values in enumerate(df.itertuples(index=False, name=None), 1)
+    ]
+
+
+def issues_from_frame(df) -> List[GeneratedIssue]:
+    """Parse every row of an enhanced DataFrame into GeneratedIssues"""
+    columns = list(df.columns)
+    return [
+        GeneratedIssue.from_row(dict(zip(columns, values)), position)
+        for position, values in enumerate(df.itertuples(index=False, name=None), 1)
+    ]
+
+
+def load_issue_numbers(log_path: str) -> Dict[int, int]:
+    """Map endpoint id to created issue number from a github_issues_log.json file
+
+    Raises FileNotFoundError/ValueError like json.load on a missing or broken log.
+    """
+    with open(log_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return {
+        int(entry['id']): int(entry['issue_number'])
+        for entry in entries
+        if entry.get('issue_number') is not None and entry.get('id') is not None
+    }
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Profiling support for the Deshio ERP pipeline scripts
+
+Used by build.py and github_issues.py when run with --profile. Records:
+- cProfile/pstats output (<prefix>.prof, loadable with `python -m pstats`)
+- wall-clock time per phase (load, resume scan, generate/create, write)
+- sampled call stacks in collapsed format (<prefix>.collapsed) for
+  flamegraph.pl, speedscope or inferno
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+SAMPLE_INTERVAL = 0.005
+
+
+class StackSampler(threading.Thread):
+    """Periodically samples the main thread's stack into collapsed-stack counts"""
+
+    def __init__(self, profiler: "Profiler", interval: float = SAMPLE_INTERVAL):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.profiler = profiler
+        self.interval = interval
+        self.target_id = threading.main_thread().ident
+        self.samples: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_id)
+            if frame is None:
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(self.profiler.current_phase or "other")
+            self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class Profiler:
+    """Phase timer plus cProfile and stack sampling; a no-op unless enabled"""
+
+    def __init__(self, enabled: bool, name: str, output_dir: str = "profile"):
+        self.enabled = enabled
+        self.name = name
+        self.output_dir = output_dir
+        self.phase_times: Dict[str, float] = {}
+        self.phase_counts: Dict[str, int] = {}
+        self.current_phase: Optional[str] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started = 0.0
+        self._stopped: Optional[float] = None
+
+    def start(self, process_started: Optional[float] = None):
+        """Start cProfile and the stack sampler
+
+        process_started is a time.perf_counter() value captured before the
+        script's third-party imports, so their cost is reported as 'startup'.
+        """
+        if not self.enabled:
+            return
+        self._started = process_started if process_started is not None else time.perf_counter()
+        if process_started is not None:
+            self.phase_times["startup"] = time.perf_counter() - process_started
+            self.phase_counts["startup"] = 1
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler(self)
+        self._sampler.start()
+        self._profile.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Accumulate wall-clock time spent in a named phase"""
+        if not self.enabled:
+            yield
+            return
+        previous = self.current_phase
+        self.current_phase = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - started
+            self.phase_counts[name] = self.phase_counts.get(name, 0) + 1
+            self.current_phase = previous
+
+    def phase_report(self) -> List[str]:
+        """Formatted wall-clock breakdown, one line per phase"""
+        total = (self._stopped or time.perf_counter()) - self._started
+        lines = []
+        for name, seconds in self.phase_times.items():
+            share = (seconds / total * 100) if total else 0.0
+            lines.append(f"{name:<14} {seconds:9.3f}s {share:6.1f}%  ({self.phase_counts[name]} calls)")
+        untracked = total - sum(self.phase_times.values())
+        lines.append(f"{'other':<14} {untracked:9.3f}s {(untracked / total * 100) if total else 0.0:6.1f}%")
+        lines.append(f"{'total':<14} {total:9.3f}s")
+        return lines
+
+    def stop(self) -> Optional[Dict[str, str]]:
+        """Stop profiling and write the .prof, .collapsed and .txt reports"""
+        if not self.enabled or self._profile is None:
+            return None
+        self._profile.disable()
+        self._sampler.stop()
+        self._stopped = time.perf_counter()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(self.output_dir, f"{self.name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+        paths = {
+            "pstats": f"{prefix}.prof",
+            "collapsed": f"{prefix}.collapsed",
+            "report": f"{prefix}.txt",
+        }
+
+        self._profile.dump_stats(paths["pstats"])
+
+        with open(paths["collapsed"], "w", encoding="utf-8") as f:
+            for stack, count in self._sampler.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+        stats_text = io.StringIO()
+        pstats.Stats(self._profile, stream=stats_text).sort_stats("cumulative").print_stats(25)
+        with open(paths["report"], "w", encoding="utf-8") as f:
+            f.write("Wall-clock by phase\n")
+            f.write("\n".join(self.phase_report()))
+            f.write("\n\n")
+            f.write(stats_text.getvalue())
+
+        return paths
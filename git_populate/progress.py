@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Non-blocking progress reporting for build.py and github_issues.py
+
+The processing loops only publish events (`update()` is a queue put); a
+single renderer thread drains the queue and decides what to write:
+- tty:  one in-place progress bar, redrawn at most FRAME_RATE times a second
+- line: a one-line summary every LINE_INTERVAL seconds (CI logs, pipes)
+- json: one JSON object per event, written to stderr or a --progress-file
+        so stdout stays human-readable
+- off:  nothing
+
+`auto` picks tty when stdout is a terminal and line otherwise.
+
+While a renderer is running, emit() queues messages (the scripts'
+print_* helpers go through it) so they are printed by the renderer thread
+above the bar instead of interleaving with it.
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, TextIO
+
+from colorama import Fore, Style
+
+MODES = ("auto", "tty", "line", "json", "off")
+FRAME_RATE = 10
+LINE_INTERVAL = 5.0
+BAR_LENGTH = 30
+
+
+# Renderer currently owning stdout, if any
+_active: Optional["ProgressRenderer"] = None
+
+
+def emit(text: str):
+    """Print a line of output, routed through the active renderer if there is one"""
+    renderer = _active
+    if renderer is not None and renderer.log(text):
+        return
+    print(text)
+
+
+class ProgressEvent(NamedTuple):
+    """One progress update (or log line) published by a processing loop"""
+    kind: str
+    current: int
+    message: str
+    # Final row status (e.g. done/failed/skipped), None while a row is in flight
+    status: Optional[str]
+    timestamp: float
+
+
+class ProgressRenderer:
+    """Renders progress events from a queue on a background thread"""
+
+    def __init__(self, total: int, mode: str = "auto", name: str = "progress", json_path: Optional[str] = None):
+        if mode == "auto":
+            mode = "tty" if sys.stdout.isatty() else "line"
+        self.total = max(total, 1)
+        self.mode = mode
+        self.name = name
+        self.json_path = json_path
+        self._json_stream: Optional[TextIO] = None
+        self.events: "queue.Queue[Optional[ProgressEvent]]" = queue.Queue()
+        self.counts: Dict[str, int] = {}
+        self.current = 0
+        self.message = ""
+        self._started = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ProgressRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Start the renderer thread"""
+        global _active
+        if self.mode == "off" or self._thread is not None:
+            return
+        if self.mode == "json":
+            self._json_stream = open(self.json_path, "a", encoding="utf-8") if self.json_path else sys.stderr
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-renderer", daemon=True)
+        self._thread.start()
+        _active = self
+
+    def update(self, current: int, message: str, status: Optional[str] = None):
+        """Publish an event; never blocks on terminal output"""
+        if self._thread is not None:
+            self.events.put_nowait(ProgressEvent("progress", current, message, status, time.time()))
+
+    def log(self, text: str) -> bool:
+        """Queue a line to print above the bar; False if the renderer is not running"""
+        if self._thread is None:
+            return False
+        self.events.put_nowait(ProgressEvent("log", self.current, text, None, time.time()))
+        return True
+
+    def close(self):
+        """Drain outstanding events, draw the final state and stop the thread"""
+        global _active
+        if self._thread is None:
+            return
+        if _active is self:
+            _active = None
+        self.events.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._json_stream is not None and self._json_stream is not sys.stderr:
+            self._json_stream.close()
+        self._json_stream = None
+
+    def _run(self):
+        frame_interval = 1.0 / FRAME_RATE
+        last_draw = 0.0
+        dirty = False
+        while True:
+            try:
+                event = self.events.get(timeout=frame_interval)
+            except queue.Empty:
+                event = False
+            if event is None:
+                break
+            if event and event.kind == "log":
+                self._write_log(event.message, drawn=last_draw > 0)
+                if self.mode == "tty" and last_draw:
+                    self._draw()
+                continue
+            if event:
+                self._apply(event)
+                dirty = True
+                if self.mode == "json":
+                    self._write_json(event)
+                    continue
+            now = time.monotonic()
+            interval = frame_interval if self.mode == "tty" else LINE_INTERVAL
+            if dirty and now - last_draw >= interval:
+                self._draw()
+                last_draw = now
+                dirty = False
+        # Always leave the final state on screen
+        if self.mode == "tty":
+            self._draw()
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+        elif self.mode == "line" and (dirty or not last_draw):
+            self._draw()
+        elif self.mode == "json":
+            self._write_json(None)
+
+    def _write_log(self, text: str, drawn: bool):
+        # Clear the bar first so the message gets a line of its own
+        prefix = "\r\x1b[K" if self.mode == "tty" and drawn else ""
+        sys.stdout.write(f"{prefix}{text}\n")
+        sys.stdout.flush()
+
+    def _apply(self, event: ProgressEvent):
+        self.current = event.current
+        self.message = event.message
+        if event.status:
+            self.counts[event.status] = self.counts.get(event.status, 0) + 1
+
+    def _rate(self) -> float:
+        finished = sum(self.counts.values())
+        elapsed = time.monotonic() - self._started
+        return finished / elapsed if elapsed > 0 else 0.0
+
+    def _draw(self):
+        percentage = self.current / self.total * 100
+        if self.mode == "tty":
+            filled_length = int(BAR_LENGTH * self.current // self.total)
+            bar = f"{Fore.GREEN}{'█' * filled_length}{Fore.WHITE}{'░' * (BAR_LENGTH - filled_length)}{Style.RESET_ALL}"
+            # \x1b[K clears what is left of a longer previous frame
+            sys.stdout.write(
+                f"\r{Fore.MAGENTA}[{self.current:3d}/{self.total:3d}] {bar} {percentage:6.1f}% "
+                f"{Fore.CYAN}{self.message}{Style.RESET_ALL}\x1b[K"
+            )
+        else:
+            counts = "".join(f" {status}={count}" for status, count in sorted(self.counts.items()))
+            remaining = self.total - sum(self.counts.values())
+            rate = self._rate()
+            eta = f" ETA {remaining / rate:.0f}s" if rate > 0 and remaining > 0 else ""
+            sys.stdout.write(
+                f"[{self.name}] {self.current}/{self.total} ({percentage:.1f}%){counts} "
+                f"{rate:.2f}/s{eta}\n"
+            )
+        sys.stdout.flush()
+
+    def _write_json(self, event: Optional[ProgressEvent]):
+        if event is None:
+            record = {"type": "summary", "name": self.name, "total": self.total, "counts": self.counts,
+                      "elapsed": round(time.monotonic() - self._started, 3)}
+        else:
+            record = {"type": "progress", "name": self.name, "current": event.current, "total": self.total,
+                      "status": event.status, "message": event.message, "time": event.timestamp}
+        self._json_stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._json_stream.flush()
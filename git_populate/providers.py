@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+LLM provider backends for build.py
+
+Every backend speaks the OpenAI-compatible `/chat/completions` protocol and
+only differs in base URL, credentials and extra headers:
+- openrouter: https://openrouter.ai/api/v1 (OPENROUTER_API_KEY)
+- openai:     https://api.openai.com/v1 or any compatible host (OPENAI_API_KEY)
+- local:      llama.cpp / vLLM / Ollama server on localhost, key optional
+              (LOCAL_LLM_API_KEY)
+
+Select one with --provider and override its endpoint with --base-url. A
+SharedRateLimiter keeps concurrent runs that share a key within one request
+budget.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from rate_limiter import SharedRateLimiter, budget_key
+
+
+class LLMProvider:
+    """Base class for OpenAI-compatible chat completion backends"""
+
+    name = "base"
+    default_base_url = ""
+    api_key_env: Optional[str] = None
+    requires_api_key = True
+    timeout = 30
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 rate_limiter: Optional[SharedRateLimiter] = None):
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        # Token usage of the most recent completion ({} if the server omitted it)
+        self.last_usage: Dict = {}
+        self.base_url = (base_url or self.default_base_url).rstrip("/")
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        self.headers.update(self.extra_headers())
+
+    def extra_headers(self) -> Dict[str, str]:
+        """Provider-specific headers added to every request"""
+        return {}
+
+    def extra_payload(self) -> Dict:
+        """Provider-specific fields added to every request body"""
+        return {}
+
+    def track_rate_limit(self, response: requests.Response):
+        """Feed rate limit headers (OpenRouter/OpenAI style) and 429s back to the shared limiter"""
+        if self.rate_limiter is None:
+            return
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            try:
+                self.rate_limiter.exhaust(float(retry_after) if retry_after else 60.0)
+            except ValueError:
+                self.rate_limiter.exhaust(60.0)
+            return
+        remaining = response.headers.get("X-RateLimit-Remaining") or response.headers.get("x-ratelimit-remaining-requests")
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            reset_at = float(reset) if reset else None
+        except ValueError:
+            reset_at = None
+        # OpenRouter reports the reset as epoch milliseconds
+        if reset_at and reset_at > 1e11:
+            reset_at /= 1000
+        if reset_at and reset_at < time.time():
+            reset_at = None
+        try:
+            self.rate_limiter.update(int(remaining) if remaining else None, reset_at)
+        except ValueError:
+            pass
+
+    def chat(self, model: str, messages: List[Dict[str, str]], temperature: float = 0.7, max_tokens: int = 3000) -> str:
+        """Send a chat completion request and return the assistant message content
+
+        Raises requests.exceptions.RequestException on transport/HTTP errors and
+        KeyError/IndexError when the response does not have the expected shape.
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        payload.update(self.extra_payload())
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = requests.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload,
+            timeout=self.timeout
+        )
+        self.track_rate_limit(response)
+        response.raise_for_status()
+        result = response.json()
+        self.last_usage = result.get('usage') or {}
+        return result['choices'][0]['message']['content'].strip()
+
+
+class OpenRouterProvider(LLMProvider):
+    """OpenRouter (hosted, many models)"""
+
+    name = "openrouter"
+    default_base_url = "https://openrouter.ai/api/v1"
+    api_key_env = "OPENROUTER_API_KEY"
+
+    def extra_headers(self) -> Dict[str, str]:
+        return {
+            "HTTP-Referer": "https://github.com/sakhadib/deshio-erp-backend",
+            "X-Title": "Deshio ERP Issue Generator"
+        }
+
+    def extra_payload(self) -> Dict:
+        # Ask OpenRouter to report the request's cost in `usage.cost`
+        return {"usage": {"include": True}}
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """OpenAI or any hosted OpenAI-compatible API"""
+
+    name = "openai"
+    default_base_url = "https://api.openai.com/v1"
+    api_key_env = "OPENAI_API_KEY"
+
+
+class LocalProvider(LLMProvider):
+    """Local OpenAI-compatible server (llama.cpp, vLLM, Ollama, ...)"""
+
+    name = "local"
+    default_base_url = "http://localhost:8000/v1"
+    api_key_env = "LOCAL_LLM_API_KEY"
+    requires_api_key = False
+    # Local models on modest hardware can take a while per completion
+    timeout = 300
+
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (OpenRouterProvider, OpenAICompatibleProvider, LocalProvider)
+}
+
+
+def create_provider(name: str, base_url: Optional[str] = None, requests_per_minute: int = 0,
+                    rate_limit_db: Optional[str] = None) -> LLMProvider:
+    """Instantiate a provider by name, reading its API key from the environment
+
+    Every process using the same key and rate limit database shares one
+    budget: requests_per_minute > 0 sets it up front, otherwise it is learned
+    from the server's X-RateLimit-* headers and 429 responses.
+
+    Raises ValueError for unknown providers or a missing required API key.
+    """
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown provider '{name}' (choose from: {', '.join(PROVIDERS)})")
+    provider_class = PROVIDERS[name]
+    api_key = os.getenv(provider_class.api_key_env) if provider_class.api_key_env else None
+    if provider_class.requires_api_key and not api_key:
+        raise ValueError(f"{provider_class.api_key_env} environment variable not found")
+    rate_limiter = SharedRateLimiter(
+        budget_key(name, f"{base_url or provider_class.default_base_url}|{api_key or ''}"),
+        capacity=max(requests_per_minute, 0),
+        window=60,
+        db_path=rate_limit_db
+    )
+    return provider_class(api_key=api_key, base_url=base_url, rate_limiter=rate_limiter)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Cross-process rate-limit state for the Deshio ERP pipeline scripts
+
+Several build.py/github_issues.py runs sharing one token (different repos or
+shards in parallel) consult and update the same budget, stored in a small
+SQLite database. Each budget is keyed by a hash of the token, so the token
+itself is never written to disk.
+
+Every request calls acquire(), which atomically takes one unit of budget
+(waiting for the window to reset when it is exhausted), and responses feed
+the server's view of the budget back through update().
+
+A capacity of 0 means the budget is not known up front: requests are only
+held back once a server has reported it (X-RateLimit-* headers) or a 429 /
+Retry-After has exhausted it.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Callable, Optional
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".cache", "deshio-erp", "rate_limits.sqlite3")
+# Budget of a fresh window when the capacity is unknown (capacity=0)
+UNKNOWN_BUDGET = 1 << 62
+
+
+def budget_key(service: str, token: Optional[str]) -> str:
+    """Stable key for a (service, token) pair that does not reveal the token"""
+    digest = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+    return f"{service}:{digest}"
+
+
+class SharedRateLimiter:
+    """Fixed-window request budget shared by every process using the same database"""
+
+    def __init__(
+        self,
+        key: str,
+        capacity: int,
+        window: float,
+        db_path: Optional[str] = None,
+        reserve: int = 0,
+        on_wait: Optional[Callable[[float], None]] = None
+    ):
+        self.key = key
+        self.capacity = capacity
+        self.window = window
+        self.reserve = reserve
+        self.on_wait = on_wait
+        self.db_path = db_path or os.getenv("DESHIO_RATE_LIMIT_DB", DEFAULT_DB_PATH)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS budgets ("
+                " key TEXT PRIMARY KEY,"
+                " remaining INTEGER NOT NULL,"
+                " reset_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None so BEGIN IMMEDIATE below controls the write lock
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _current(self, conn: sqlite3.Connection, now: float):
+        """Return (remaining, reset_at), starting a fresh window if the last one expired"""
+        row = conn.execute("SELECT remaining, reset_at FROM budgets WHERE key = ?", (self.key,)).fetchone()
+        if row is None or row[1] <= now:
+            return self._fresh_budget(), now + self.window
+        return row
+
+    def _fresh_budget(self) -> int:
+        return self.capacity if self.capacity > 0 else UNKNOWN_BUDGET
+
+    def _store(self, conn: sqlite3.Connection, remaining: int, reset_at: float, now: float):
+        conn.execute(
+            "INSERT INTO budgets (key, remaining, reset_at, updated_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET remaining = excluded.remaining,"
+            " reset_at = excluded.reset_at, updated_at = excluded.updated_at",
+            (self.key, remaining, reset_at, now)
+        )
+
+    def acquire(self):
+        """Take one request from the shared budget, waiting for a reset if it is exhausted"""
+        while True:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                now = time.time()
+                remaining, reset_at = self._current(conn, now)
+                if remaining > self.reserve:
+                    self._store(conn, remaining - 1, reset_at, now)
+                    conn.execute("COMMIT")
+                    return
+                conn.execute("ROLLBACK")
+            finally:
+                conn.close()
+            wait = max(1.0, reset_at - now + 1)
+            if self.on_wait:
+                self.on_wait(wait)
+            time.sleep(wait)
+
+    def update(self, remaining: Optional[int] = None, reset_at: Optional[float] = None):
+        """Record the budget reported by the server (e.g. X-RateLimit-* headers)
+
+        A newer (or first) window replaces the stored state; within the same
+        window the lower remaining count wins, since other processes may have
+        spent more.
+        """
+        if remaining is None and reset_at is None:
+            return
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT remaining, reset_at FROM budgets WHERE key = ?", (self.key,)).fetchone()
+            stored_remaining, stored_reset = self._current(conn, now)
+            fresh = row is None or row[1] <= now
+            # With an unknown capacity the stored window is a placeholder, so an
+            # earlier server reset replaces it too
+            placeholder = self.capacity <= 0 and reset_at is not None and reset_at < stored_reset - 1
+            if reset_at is not None and (fresh or reset_at > stored_reset + 1 or placeholder):
+                new_remaining = remaining if remaining is not None else self._fresh_budget()
+                new_reset = reset_at
+            else:
+                new_remaining = min(stored_remaining, remaining) if remaining is not None else stored_remaining
+                new_reset = stored_reset if reset_at is None else max(stored_reset, reset_at)
+            self._store(conn, new_remaining, new_reset, now)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def exhaust(self, retry_after: float):
+        """Mark the budget as used up for retry_after seconds (e.g. after an HTTP 429)
+
+        The block ends after retry_after even if the current window runs longer
+        (a one-minute secondary limit must not stall runs until an hourly
+        reset); the next response's headers then restore the real budget.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            self._store(conn, 0, now + retry_after, now)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
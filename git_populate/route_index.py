@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Route index over the Laravel backend's routes/api.php
+
+Parses `Route::get/post/put/patch/delete/any(...)` declarations, resolving
+nested `Route::prefix(...)->group(function () { ... })` blocks, and compiles
+them into a per-method segment trie. Catalog routes such as
+`api/orders/{id}/confirm` are then matched in O(segments) each, with any
+`{param}` segment matching any Laravel `{param}` segment.
+
+Usage:
+    python route_index.py --routes ../backend/routes/api.php --csv enhanced_doc.csv
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+
+import pandas as pd
+
+from models import endpoints_from_frame
+
+API_PREFIX = "api"
+PARAM = "{}"
+ALL_METHODS = ("get", "post", "put", "patch", "delete")
+# Laravel resource routes register PUT and PATCH for the same update action
+EQUIVALENT_METHODS = {"put": ("put", "patch"), "patch": ("patch", "put")}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/|(?<![:'\"])//[^\n]*|#[^\n]*", re.S)
+_TOKEN_RE = re.compile(
+    r"""Route::(?P<verb>get|post|put|patch|delete|options|any)\(\s*['"](?P<path>[^'"]*)['"]"""
+    r"""|(?P<group>Route::(?:'[^']*'|"[^"]*"|(?!Route::)[^;{}'"])*?->group\(\s*function\s*\([^)]*\)\s*(?:use\s*\([^)]*\)\s*)?\{)"""
+    r"""|(?P<open>\{)|(?P<close>\})"""
+)
+_PREFIX_RE = re.compile(r"""prefix\(\s*['"]([^'"]*)['"]\s*\)""")
+
+
+def split_route(route: str) -> List[str]:
+    """Split a route into segments, collapsing every {param} to a wildcard"""
+    segments = []
+    for segment in route.strip().strip("/").split("/"):
+        if not segment:
+            continue
+        segments.append(PARAM if segment.startswith("{") and segment.endswith("}") else segment.lower())
+    return segments
+
+
+def parse_routes(source: str) -> List[Tuple[str, str]]:
+    """Extract (method, full route) pairs from the contents of routes/api.php"""
+    source = _COMMENT_RE.sub("", source)
+    routes: List[Tuple[str, str]] = []
+    # Stack of (brace depth the group was opened at, prefix segments it adds)
+    groups: List[Tuple[int, List[str]]] = []
+    depth = 0
+
+    for match in _TOKEN_RE.finditer(source):
+        if match.group("verb"):
+            prefix = [API_PREFIX] + [segment for _, segments in groups for segment in segments]
+            full = "/".join(prefix + [s for s in match.group("path").strip("/").split("/") if s])
+            verb = match.group("verb")
+            for method in (ALL_METHODS if verb == "any" else (verb,)):
+                routes.append((method, full))
+        elif match.group("group"):
+            depth += 1
+            prefixes = _PREFIX_RE.findall(match.group("group"))
+            segments = [s for prefix in prefixes for s in prefix.strip("/").split("/") if s]
+            groups.append((depth, segments))
+        elif match.group("open"):
+            depth += 1
+        elif match.group("close"):
+            if groups and groups[-1][0] == depth:
+                groups.pop()
+            depth = max(0, depth - 1)
+    return routes
+
+
+class RouteIndex:
+    """Per-method segment trie of implemented routes"""
+
+    def __init__(self, routes: Iterable[Tuple[str, str]] = ()):
+        self.roots: Dict[str, Dict] = {}
+        self.size = 0
+        for method, route in routes:
+            self.add(method, route)
+
+    @classmethod
+    def from_file(cls, path: str) -> "RouteIndex":
+        """Build an index from a Laravel routes file"""
+        with open(path, encoding="utf-8") as f:
+            return cls(parse_routes(f.read()))
+
+    def add(self, method: str, route: str):
+        """Insert one implemented route"""
+        node = self.roots.setdefault(method.lower(), {})
+        for segment in split_route(route):
+            node = node.setdefault(segment, {})
+        if not node.get(None):
+            node[None] = True
+            self.size += 1
+
+    def _walk(self, node: Dict, segments: List[str]) -> bool:
+        for segment in segments:
+            child = node.get(segment)
+            if child is None:
+                return False
+            node = child
+        return bool(node.get(None))
+
+    def match(self, method: str, route: str) -> bool:
+        """Whether a catalog route + HTTP method is implemented"""
+        segments = split_route(route)
+        method = method.lower()
+        for candidate in EQUIVALENT_METHODS.get(method, (method,)):
+            root = self.roots.get(candidate)
+            if root is not None and self._walk(root, segments):
+                return True
+        return False
+
+    def implemented(self, endpoints: Iterable[Tuple[object, str, str]]) -> Set[object]:
+        """Keys of the (key, method, route) triples that are implemented"""
+        return {key for key, method, route in endpoints if self.match(method, route)}
+
+
+def main():
+    """Report which catalog endpoints are implemented by the backend"""
+    parser = argparse.ArgumentParser(
+        description="Match Deshio ERP catalog routes against the Laravel routes file"
+    )
+    parser.add_argument(
+        "--routes",
+        default="../backend/routes/api.php",
+        help="Laravel routes file (default: ../backend/routes/api.php)"
+    )
+    parser.add_argument(
+        "--csv",
+        default="enhanced_doc.csv",
+        help="Catalog CSV file with route and Type columns (default: enhanced_doc.csv)"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = RouteIndex.from_file(args.routes)
+    built = time.perf_counter()
+    endpoints = [(e.id, e.method, e.route) for e in endpoints_from_frame(pd.read_csv(args.csv))]
+    loaded = time.perf_counter()
+    implemented = index.implemented(endpoints)
+    finished = time.perf_counter()
+
+    print(f"Indexed {index.size} routes in {(built - started) * 1000:.1f} ms")
+    print(f"Matched {len(endpoints)} endpoints in {(finished - loaded) * 1000:.1f} ms")
+    print(f"Implemented: {len(implemented)}/{len(endpoints)}")
+    for key, method, route in endpoints:
+        if key in implemented:
+            print(f"  #{key} {method.upper()} {route}")
+
+
+if __name__ == "__main__":
+    main()